@@ -40,6 +40,43 @@ class AdaptableHeapPriorityQueue(HeapPriorityQueue):
     self._data[i]._index = i             # reset locator index (post-swap)
     self._data[j]._index = j             # reset locator index (post-swap)
 
+  # override sifting to record new indices of every item the hole passes
+  def _upheap(self, j):
+    data = self._data
+    item = data[j]
+    key = item._key
+    while j > 0:
+      parent = (j-1) >> 1
+      above = data[parent]
+      if not key < above._key:
+        break
+      data[j] = above
+      above._index = j                   # reset locator index (post-shift)
+      j = parent
+    data[j] = item
+    item._index = j
+
+  def _downheap(self, j):
+    data = self._data
+    n = len(data)
+    item = data[j]
+    key = item._key
+    child = 2*j + 1
+    while child < n:
+      small = data[child]
+      right = child + 1
+      if right < n and data[right]._key < small._key:
+        child = right
+        small = data[right]
+      if not small._key < key:
+        break
+      data[j] = small
+      small._index = j                   # reset locator index (post-shift)
+      j = child
+      child = 2*j + 1
+    data[j] = item
+    item._index = j
+
   def _bubble(self, j):
     if j > 0 and self._data[j] < self._data[self._parent(j)]:
       self._upheap(j)
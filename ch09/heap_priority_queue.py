@@ -46,22 +46,38 @@ class HeapPriorityQueue(PriorityQueueBase): # base class defines _Item
     self._data[i], self._data[j] = self._data[j], self._data[i]
 
   def _upheap(self, j):
-    parent = self._parent(j)
-    if j > 0 and self._data[j] < self._data[parent]:
-      self._swap(j, parent)
-      self._upheap(parent)             # recur at position of parent
-  
+    """Move the item at index j up until its parent is no larger."""
+    data = self._data
+    item = data[j]                     # lift the item out, leaving a hole
+    key = item._key
+    while j > 0:
+      parent = (j-1) >> 1
+      above = data[parent]
+      if not key < above._key:
+        break
+      data[j] = above                  # shift parent down into the hole
+      j = parent
+    data[j] = item                     # single write of the lifted item
+
   def _downheap(self, j):
-    if self._has_left(j):
-      left = self._left(j)
-      small_child = left               # although right may be smaller
-      if self._has_right(j):
-        right = self._right(j)
-        if self._data[right] < self._data[left]:
-          small_child = right
-      if self._data[small_child] < self._data[j]:
-        self._swap(j, small_child)
-        self._downheap(small_child)    # recur at position of small child
+    """Move the item at index j down until no child is smaller."""
+    data = self._data
+    n = len(data)
+    item = data[j]                     # lift the item out, leaving a hole
+    key = item._key
+    child = 2*j + 1
+    while child < n:
+      small = data[child]              # although right may be smaller
+      right = child + 1
+      if right < n and data[right]._key < small._key:
+        child = right
+        small = data[right]
+      if not small._key < key:
+        break
+      data[j] = small                  # shift small child up into the hole
+      j = child
+      child = 2*j + 1
+    data[j] = item                     # single write of the lifted item
 
   #------------------------------ public behaviors ------------------------------
   def __init__(self):
@@ -94,7 +110,12 @@ class HeapPriorityQueue(PriorityQueueBase): # base class defines _Item
     """
     if self.is_empty():
       raise Empty('Priority queue is empty.')
-    self._swap(0, len(self._data) - 1)           # put minimum item at the end
-    item = self._data.pop()                      # and remove it from the list;
-    self._downheap(0)                            # then fix new root
+    data = self._data
+    last = data.pop()                            # remove the final item;
+    if data:
+      item = data[0]                             # it replaces the minimum
+      data[0] = last
+      self._downheap(0)                          # then fix new root
+    else:
+      item = last
     return (item._key, item._value)
@@ -0,0 +1,324 @@
+# Copyright 2013, Michael H. Goldwasser
+#
+# Developed for use with the book:
+#
+#    Data Structures and Algorithms in Python
+#    Michael T. Goodrich, Roberto Tamassia, and Michael H. Goldwasser
+#    John Wiley & Sons, 2013
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from heap_priority_queue import HeapPriorityQueue
+from exceptions import Empty
+
+
+class AdaptableHeapPriorityQueue(HeapPriorityQueue):
+    """A locator-based priority queue implemented with a d-ary heap (binary by default)."""
+
+    # ------------------------------ nested Locator class ------------------------------
+    class Locator(HeapPriorityQueue._Item):
+        """Token for locating an entry of the priority queue."""
+
+        __slots__ = "_index"  # add index as additional field
+
+        def __init__(self, k, v, j):
+            super().__init__(k, v)
+            self._index = j
+
+    # ------------------------------ nonpublic behaviors ------------------------------
+    # override swap to record new indices
+    def _swap(self, i, j):
+        super()._swap(i, j)  # perform the swap
+        self._data[i]._index = i  # reset locator index (post-swap)
+        self._data[j]._index = j  # reset locator index (post-swap)
+
+    # override sifting to record new indices of every item the hole passes
+    def _upheap(self, j):
+        data = self._data
+        d = self._arity
+        item = data[j]
+        key = item._key
+        while j > 0:
+            parent = (j - 1) // d
+            above = data[parent]
+            if not key < above._key:
+                break
+            data[j] = above
+            above._index = j  # reset locator index (post-shift)
+            j = parent
+        data[j] = item
+        item._index = j
+
+    def _downheap(self, j):
+        data = self._data
+        n = len(data)
+        d = self._arity
+        item = data[j]
+        key = item._key
+        child = d * j + 1
+        while child < n:
+            small = data[child]
+            if d == 2:
+                right = child + 1
+                if right < n and data[right]._key < small._key:
+                    child = right
+                    small = data[right]
+            else:
+                small_key = small._key
+                for c in range(child + 1, min(child + d, n)):
+                    other = data[c]
+                    if other._key < small_key:
+                        child, small, small_key = c, other, other._key
+            if not small._key < key:
+                break
+            data[j] = small
+            small._index = j  # reset locator index (post-shift)
+            j = child
+            child = d * j + 1
+        data[j] = item
+        item._index = j
+
+    def _remove_sorted_prefix(self, k):
+        batch = super()._remove_sorted_prefix(k)
+        for j, token in enumerate(self._data):  # every index may have moved
+            token._index = j
+        return batch
+
+    def _remove_indices(self, indices):
+        batch = super()._remove_indices(indices)
+        for j, token in enumerate(self._data):  # every index may have moved
+            token._index = j
+        return batch
+
+    def _bubble(self, j):
+        if j > 0 and self._data[j] < self._data[self._parent(j)]:
+            self._upheap(j)
+        else:
+            self._downheap(j)
+
+    def _validate(self, loc):
+        """Return the index of Locator loc, or raise ValueError if invalid."""
+        j = loc._index
+        if (
+            not (0 <= j < len(self._data) and self._data[j] is loc)
+            or loc in self._tombstones
+        ):
+            raise ValueError("Invalid locator")
+        return j
+
+    def _restore(self, keys, values):
+        """Replace the contents with Locators built from parallel keys and values."""
+        self._data = list(map(self.Locator, keys, values, range(len(values))))
+
+    def _purge(self):
+        """Discard tombstoned entries from the root until the root is live."""
+        data = self._data
+        tombstones = self._tombstones
+        while tombstones and data[0] in tombstones:
+            tombstones.remove(data[0])
+            last = data.pop()
+            if data:
+                data[0] = last
+                self._downheap(0)
+
+    def _compact(self):
+        """Drop every tombstoned entry and rebuild the heap in O(n) time."""
+        tombstones = self._tombstones
+        self._data = [token for token in self._data if token not in tombstones]
+        tombstones.clear()
+        for j, token in enumerate(self._data):
+            token._index = j
+        self._heapify()
+
+    # ------------------------------ public behaviors ------------------------------
+    def __init__(self, arity=2, lazy=False, compact_ratio=0.5):
+        """Create a new empty Priority Queue.
+
+        In lazy mode remove only marks the entry's Locator as dead (a
+        tombstone); dead entries are skipped when they reach the root, and
+        the heap is compacted once tombstones exceed compact_ratio of it.
+        """
+        super().__init__(arity)
+        if not 0 < compact_ratio <= 1:
+            raise ValueError("compact_ratio must be in (0, 1]")
+        self._lazy = lazy
+        self._compact_ratio = compact_ratio
+        self._tombstones = set()  # dead Locators still stored in the heap
+
+    def __len__(self):
+        """Return the number of live items in the priority queue."""
+        return len(self._data) - len(self._tombstones)
+
+    def add(self, key, value):
+        """Add a key-value pair and return a Locator for the new entry."""
+        token = self.Locator(key, value, len(self._data))  # initiaize locator index
+        self._data.append(token)
+        self._upheap(len(self._data) - 1)
+        return token
+
+    def add_all(self, pairs):
+        """Add every (k,v) pair from an iterable and return a list of their Locators."""
+        start = len(self._data)
+        Locator = self.Locator
+        tokens = [Locator(k, v, j) for j, (k, v) in enumerate(pairs, start)]
+        self._data.extend(tokens)
+        self._repair_tail(start)
+        return tokens
+
+    def pushpop(self, key, value):
+        """Add a key-value pair, then remove and return the (k,v) tuple with minimum key.
+
+        The new pair is returned untouched, without entering the heap, if
+        its key is no larger than the current minimum.
+        """
+        return self.pushpop_locator(key, value)[0]
+
+    def pushpop_locator(self, key, value):
+        """Like pushpop, but also return the Locator of the new entry.
+
+        Return a pair ((k,v), loc), where loc is None if the new pair was
+        returned without entering the heap.
+        """
+        self._purge()
+        data = self._data
+        if not data or not data[0]._key < key:
+            return (key, value), None
+        item = data[0]
+        token = data[0] = self.Locator(key, value, 0)
+        self._downheap(0)
+        return (item._key, item._value), token
+
+    def replace_min(self, key, value):
+        """Remove and return the (k,v) tuple with minimum key, then add a key-value pair.
+
+        Raise Empty exception if empty.
+        """
+        return self.replace_min_locator(key, value)[0]
+
+    def replace_min_locator(self, key, value):
+        """Like replace_min, but also return the Locator of the new entry.
+
+        Return a pair ((k,v), loc).  Raise Empty exception if empty.
+        """
+        if self.is_empty():
+            raise Empty("Priority queue is empty.")
+        self._purge()
+        data = self._data
+        item = data[0]
+        token = data[0] = self.Locator(key, value, 0)
+        self._downheap(0)
+        return (item._key, item._value), token
+
+    def min(self):
+        """Return but do not remove (k,v) tuple with minimum key.
+
+        Raise Empty exception if empty.
+        """
+        self._purge()
+        return super().min()
+
+    def remove_min(self):
+        """Remove and return (k,v) tuple with minimum key.
+
+        Raise Empty exception if empty.
+        """
+        self._purge()
+        return super().remove_min()
+
+    def remove_min_many(self, k):
+        """Remove and return a list of the k (k,v) tuples with smallest keys.
+
+        Tuples are listed in nondecreasing key order; fewer than k are
+        returned if the priority queue holds fewer than k items.
+        """
+        if not self._tombstones:
+            return super().remove_min_many(k)
+        if k < 0:
+            raise ValueError("k must be nonnegative")
+        return [self.remove_min() for _ in range(min(k, len(self)))]
+
+    def pop_while(self, predicate):
+        """Remove and return minimum (k,v) tuples for as long as predicate(k) holds.
+
+        Tuples are listed in nondecreasing key order.  predicate must hold
+        for a prefix of the key order: if it holds for a key, it holds for
+        every smaller key.
+        """
+        if not self._tombstones:
+            return super().pop_while(predicate)
+        result = []
+        while not self.is_empty() and predicate(self.min()[0]):
+            result.append(self.remove_min())
+        return result
+
+    def update(self, loc, newkey, newval):
+        """Update the key and value for the entry identified by Locator loc."""
+        j = self._validate(loc)
+        loc._key = newkey
+        loc._value = newval
+        self._bubble(j)
+
+    def update_many(self, changes):
+        """Apply (loc, newkey, newval) updates from an iterable, then repair once.
+
+        A batch touching at least a quarter of the entries is applied in full
+        and repaired with one O(n) heapify, which also rewrites the index of
+        every Locator it moves; smaller batches are bubbled entry by entry.
+        Raise ValueError, leaving every entry unchanged, if any Locator is
+        invalid.
+        """
+        changes = list(changes)
+        for loc, _, _ in changes:  # reject the whole batch before changing anything
+            self._validate(loc)
+        if 4 * len(changes) < len(self._data):
+            for loc, newkey, newval in changes:  # each bubble needs a valid heap
+                self.update(loc, newkey, newval)
+            return
+        for loc, newkey, newval in changes:
+            loc._key = newkey
+            loc._value = newval
+        self._heapify()
+
+    def decrease_key(self, loc, newkey):
+        """Lower the key of the entry identified by Locator loc to newkey."""
+        j = self._validate(loc)
+        if loc._key < newkey:
+            raise ValueError("new key must not be larger than the current key")
+        loc._key = newkey
+        self._upheap(j)  # a smaller key can only move up
+
+    def remove(self, loc):
+        """Remove and return the (k,v) pair identified by Locator loc."""
+        j = self._validate(loc)
+        if self._lazy:
+            self._tombstones.add(loc)  # leave the entry in place, marked dead
+            if len(self._tombstones) > self._compact_ratio * len(self._data):
+                self._compact()
+        elif j == len(self._data) - 1:  # item at last position
+            self._data.pop()  # just remove it
+        else:
+            self._swap(j, len(self._data) - 1)  # swap item to the last position
+            self._data.pop()  # remove it from the list
+            self._bubble(j)  # fix item displaced by the swap
+        return (loc._key, loc._value)
+
+    def dump(self, fileobj):
+        """Write the live entries to a binary file object, keeping the heap order.
+
+        Tombstoned entries are compacted away first.  Locators are not
+        saved, so a queue created by load has no Locators for its entries.
+        """
+        if self._tombstones:
+            self._compact()
+        super().dump(fileobj)
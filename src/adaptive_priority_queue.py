@@ -0,0 +1,180 @@
+# Copyright 2013, Michael H. Goldwasser
+#
+# Developed for use with the book:
+#
+#    Data Structures and Algorithms in Python
+#    Michael T. Goodrich, Roberto Tamassia, and Michael H. Goldwasser
+#    John Wiley & Sons, 2013
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+from math import log2
+
+from priority_queue_base import PriorityQueueBase
+from heap_priority_queue import HeapPriorityQueue
+from sorted_priority_queue import SortedPriorityQueue
+from unsorted_priority_queue import UnsortedPriorityQueue
+
+
+class AdaptivePriorityQueue(PriorityQueueBase):
+    """A priority queue that picks its representation from the observed workload.
+
+    Operations are delegated to one engine: a SortedPriorityQueue,
+    UnsortedPriorityQueue or HeapPriorityQueue.  Over each window of
+    operations the queue counts adds, min queries and removals, and how
+    many adds arrived in nondecreasing key order, then predicts what the
+    window would have cost under each engine.  Contents migrate to a
+    cheaper engine only when it wins by the hysteresis factor and its
+    savings, accumulated over consecutive windows, have paid for the
+    migration, so a mixed workload does not make the queue flip-flop.
+    """
+
+    _ENGINES = {
+        "sorted": SortedPriorityQueue,
+        "unsorted": UnsortedPriorityQueue,
+        "heap": HeapPriorityQueue,
+    }
+    _MIGRATE = 3.0  # rough cost of moving one entry between engines, in microseconds
+
+    # ------------------------------ nonpublic behaviors ------------------------------
+    def _predict(self, n):
+        """Return the predicted cost of the last window for each engine.
+
+        Per-operation costs are rough CPython timings in microseconds for a
+        queue of n entries.  A sorted add walks back from the largest key;
+        an add out of order is assumed to walk past half of the entries.
+        """
+        adds, queries, removes = self._adds, self._queries, self._removes
+        walk = (adds - self._in_order) * n / 2
+        return {
+            "sorted": 2.5 * adds + 0.9 * walk + 0.4 * queries + 1.7 * removes,
+            "unsorted": 2.0 * adds + (0.5 + 1.0 * n) * (queries + removes),
+            "heap": 1.0 * adds + 0.3 * queries + (0.5 + 0.25 * log2(n + 1)) * removes,
+        }
+
+    def _tick(self):
+        """Count one operation, deciding on the engine at the end of a window."""
+        self._ops += 1
+        if self._ops == self._window:
+            self._decide()
+            self._ops = self._adds = self._in_order = 0
+            self._queries = self._removes = 0
+
+    def _decide(self):
+        """Switch engines if another has been cheaper for long enough."""
+        n = len(self._pq)
+        costs = self._predict(n)
+        best = min(costs, key=costs.get)
+        current = costs[self._engine]
+        if best == self._engine or costs[best] * self._hysteresis > current:
+            self._candidate = None  # the active engine is good enough
+            self._savings = 0
+            return
+        if best != self._candidate:
+            self._candidate = best
+            self._savings = 0
+        self._savings += current - costs[best]
+        if self._savings >= self._MIGRATE * n:
+            self._reason = (
+                "predicted {0:.0f} vs {1:.0f} us per {2} ops as {3} "
+                "({4} adds, {5} in order, {6} mins, {7} removes, n={8})".format(
+                    costs[best],
+                    current,
+                    self._window,
+                    self._engine,
+                    self._adds,
+                    self._in_order,
+                    self._queries,
+                    self._removes,
+                    n,
+                )
+            )
+            self._migrate(best)
+
+    def _migrate(self, name):
+        """Move every item into a new engine of the given name."""
+        pairs = self._pq.remove_min_many(len(self._pq))  # sorted by every engine
+        pq = self._ENGINES[name]()
+        for key, value in pairs:  # O(1) each in key order, even for sorted and heap
+            pq.add(key, value)
+        self._pq = pq
+        self._engine = name
+        self._candidate = None
+        self._savings = 0
+
+    # ------------------------------ public behaviors ------------------------------
+    def __init__(self, engine="heap", window=128, hysteresis=1.5):
+        """Create a new empty Priority Queue, starting with the named engine.
+
+        The workload is judged every window operations; another engine must
+        be predicted at least hysteresis times cheaper to be adopted.
+        """
+        if engine not in self._ENGINES:
+            raise ValueError("engine must be one of " + ", ".join(self._ENGINES))
+        if window < 1:
+            raise ValueError("window must be at least 1")
+        if hysteresis < 1:
+            raise ValueError("hysteresis must be at least 1")
+        self._pq = self._ENGINES[engine]()
+        self._engine = engine
+        self._reason = "initial engine"
+        self._window = window
+        self._hysteresis = hysteresis
+        self._candidate = None  # engine currently predicted to be cheaper
+        self._savings = 0  # its predicted savings accumulated so far
+        self._last_key = None
+        self._ops = self._adds = self._in_order = 0
+        self._queries = self._removes = 0
+
+    def __len__(self):
+        """Return the number of items in the priority queue."""
+        return len(self._pq)
+
+    def engine(self):
+        """Return the name of the active engine: 'sorted', 'unsorted' or 'heap'."""
+        return self._engine
+
+    def reason(self):
+        """Return a description of why the active engine was chosen."""
+        return self._reason
+
+    def add(self, key, value):
+        """Add a key-value pair."""
+        self._pq.add(key, value)
+        self._adds += 1
+        if self._last_key is None or not key < self._last_key:
+            self._in_order += 1
+        self._last_key = key
+        self._tick()
+
+    def min(self):
+        """Return but do not remove (k,v) tuple with minimum key.
+
+        Raise Empty exception if empty.
+        """
+        pair = self._pq.min()
+        self._queries += 1
+        self._tick()
+        return pair
+
+    def remove_min(self):
+        """Remove and return (k,v) tuple with minimum key.
+
+        Raise Empty exception if empty.
+        """
+        pair = self._pq.remove_min()
+        self._removes += 1
+        self._tick()
+        return pair
@@ -0,0 +1,160 @@
+# Copyright 2013, Michael H. Goldwasser
+#
+# Developed for use with the book:
+#
+#    Data Structures and Algorithms in Python
+#    Michael T. Goodrich, Roberto Tamassia, and Michael H. Goldwasser
+#    John Wiley & Sons, 2013
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+from operator import itemgetter
+
+from priority_queue_base import PriorityQueueBase
+from exceptions import Empty
+
+
+class ArraySortedPriorityQueue(PriorityQueueBase):
+    """A min-oriented priority queue implemented with sorted Python lists.
+
+    Keys and values are kept in parallel lists in nonincreasing key order,
+    so the minimum is at the end and remove_min is an O(1) pop().  An add
+    binary searches the keys for its index, then inserts with one memmove.
+    Among equal keys, the one added first is removed first.
+    """
+
+    # ------------------------------ nonpublic behaviors ------------------------------
+    def _insert_index(self, key):
+        """Return the number of stored keys greater than key."""
+        keys = self._keys
+        low, high = 0, len(keys)
+        while low < high:
+            mid = (low + high) >> 1
+            if key < keys[mid]:
+                low = mid + 1
+            else:
+                high = mid
+        return low
+
+    # ------------------------------ public behaviors ------------------------------
+    def __init__(self):
+        """Create a new empty Priority Queue."""
+        self._keys = []
+        self._values = []
+
+    def __len__(self):
+        """Return the number of items in the priority queue."""
+        return len(self._keys)
+
+    def add(self, key, value):
+        """Add a key-value pair."""
+        j = self._insert_index(key)  # ahead of equal keys, which were added earlier
+        self._keys.insert(j, key)
+        self._values.insert(j, value)
+
+    def add_many(self, pairs):
+        """Add every (k,v) pair from an iterable in a single merge pass.
+
+        The batch is sorted once and merged with the stored entries in
+        O(n + m log m) time.  A batch whose keys are no smaller than the
+        current maximum is placed in front with one slice assignment, and
+        one whose keys are all below the current minimum is appended.
+        Equal keys keep the order in which they were added.
+        """
+        batch = sorted(pairs, key=itemgetter(0))  # stable for equal keys
+        if not batch:
+            return
+        keys = self._keys
+        values = self._values
+        if keys and batch[0][0] < keys[0] and not batch[-1][0] < keys[-1]:
+            # timsort merges the two ascending runs in linear time, stored
+            # entries first so that they stay ahead of equal keys in the batch
+            batch = sorted(
+                [*zip(reversed(keys), reversed(values)), *batch], key=itemgetter(0)
+            )
+            keys.clear()
+            values.clear()
+        new_keys = [k for k, _ in reversed(batch)]
+        new_values = [v for _, v in reversed(batch)]
+        if keys and batch[-1][0] < keys[-1]:  # all below the minimum
+            keys.extend(new_keys)
+            values.extend(new_values)
+        else:  # all past the maximum, or the merged whole
+            keys[:0] = new_keys
+            values[:0] = new_values
+
+    def min(self):
+        """Return but do not remove (k,v) tuple with minimum key.
+
+        Raise Empty exception if empty.
+        """
+        if self.is_empty():
+            raise Empty("Priority queue is empty.")
+        return (self._keys[-1], self._values[-1])
+
+    def remove_min(self):
+        """Remove and return (k,v) tuple with minimum key.
+
+        Raise Empty exception if empty.
+        """
+        if self.is_empty():
+            raise Empty("Priority queue is empty.")
+        return (self._keys.pop(), self._values.pop())
+
+    def remove_min_many(self, k):
+        """Remove and return a list of the k (k,v) tuples with smallest keys.
+
+        Tuples are listed in nondecreasing key order; fewer than k are
+        returned if the priority queue holds fewer than k items.
+        """
+        if k < 0:
+            raise ValueError("k must be nonnegative")
+        start = len(self._keys) - min(k, len(self._keys))
+        result = list(zip(reversed(self._keys[start:]), reversed(self._values[start:])))
+        del self._keys[start:]
+        del self._values[start:]
+        return result
+
+    def pop_while(self, predicate):
+        """Remove and return minimum (k,v) tuples for as long as predicate(k) holds.
+
+        Tuples are listed in nondecreasing key order.  predicate must hold
+        for a prefix of the key order: if it holds for a key, it holds for
+        every smaller key.
+        """
+        keys = self._keys
+        low, high = 0, len(keys)
+        while low < high:  # find where the tail of satisfying keys starts
+            mid = (low + high) >> 1
+            if predicate(keys[mid]):
+                high = mid
+            else:
+                low = mid + 1
+        return self.remove_min_many(len(keys) - low)  # one slice off the end
+
+    def remove_until(self, threshold):
+        """Remove and return every (k,v) tuple with key no greater than threshold.
+
+        Tuples are listed in nondecreasing key order.
+        """
+        return self.remove_min_many(len(self._keys) - self._insert_index(threshold))
+
+    def drain(self):
+        """Generate (k,v) tuples in nondecreasing key order until empty.
+
+        Each tuple is removed from the priority queue as it is generated.
+        """
+        while self._keys:
+            yield (self._keys.pop(), self._values.pop())
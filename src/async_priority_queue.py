@@ -0,0 +1,153 @@
+# Copyright 2013, Michael H. Goldwasser
+#
+# Developed for use with the book:
+#
+#    Data Structures and Algorithms in Python
+#    Michael T. Goodrich, Roberto Tamassia, and Michael H. Goldwasser
+#    John Wiley & Sons, 2013
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import asyncio
+import collections
+from operator import itemgetter
+
+from heap_priority_queue import HeapPriorityQueue
+from exceptions import Full
+
+
+class AsyncPriorityQueue:
+    """An asyncio adapter over any PriorityQueueBase implementation.
+
+    Waiting coroutines park on futures and are woken one at a time when
+    an entry arrives (getters) or room frees up (putters), so nothing
+    polls.  Locators returned by the wrapped queue's add stay usable, so
+    entries of an AdaptableHeapPriorityQueue can be re-prioritized while
+    consumers await them.
+    """
+
+    # ------------------------------ nonpublic behaviors ------------------------------
+    def _wakeup_next(self, waiters):
+        """Wake the first waiter in the deque that is still waiting."""
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                break
+
+    async def _wait(self, waiters, timeout=None):
+        """Park on a new future in waiters until woken; False if timeout expires."""
+        waiter = asyncio.get_running_loop().create_future()
+        waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter, timeout)
+        except BaseException as exc:  # timeout and cancellation alike
+            waiter.cancel()  # just in case waiter is not done yet
+            try:
+                waiters.remove(waiter)
+            except ValueError:  # already removed by a wakeup, which wait_for
+                self._wakeup_next(waiters)  # may still time out: pass it along
+            if isinstance(exc, asyncio.TimeoutError):
+                return False
+            raise
+        return True
+
+    # ------------------------------ public behaviors ------------------------------
+    def __init__(self, pq=None, maxsize=0):
+        """Create a queue wrapping pq (a new HeapPriorityQueue by default).
+
+        If maxsize is positive, put waits (and put_nowait raises Full) while
+        maxsize entries are queued.
+        """
+        self._pq = HeapPriorityQueue() if pq is None else pq
+        self._maxsize = maxsize
+        self._getters = collections.deque()
+        self._putters = collections.deque()
+
+    def __len__(self):
+        """Return the number of queued entries."""
+        return len(self._pq)
+
+    def is_empty(self):
+        """Return True if no entries are queued."""
+        return self._pq.is_empty()
+
+    def is_full(self):
+        """Return True if the queue holds maxsize entries."""
+        return 0 < self._maxsize <= len(self._pq)
+
+    def put_nowait(self, key, value):
+        """Add a key-value pair without waiting and return what pq.add returns.
+
+        Raise Full exception if the queue is full.
+        """
+        if self.is_full():
+            raise Full("Priority queue is full.")
+        token = self._pq.add(key, value)
+        self._wakeup_next(self._getters)
+        return token
+
+    async def put(self, key, value):
+        """Add a key-value pair, waiting for room if the queue is full."""
+        while self.is_full():
+            await self._wait(self._putters)
+        return self.put_nowait(key, value)
+
+    def get_nowait(self):
+        """Remove and return the (k,v) tuple with minimum key without waiting.
+
+        Raise Empty exception if empty.
+        """
+        item = self._pq.remove_min()  # raises Empty
+        self._wakeup_next(self._putters)
+        return item
+
+    async def get(self):
+        """Remove and return the (k,v) tuple with minimum key, waiting if empty."""
+        while self.is_empty():
+            await self._wait(self._getters)
+        return self.get_nowait()
+
+    async def get_batch(self, max_items, max_wait=0):
+        """Remove and return a list of up to max_items (k,v) tuples in key order.
+
+        Wait for a first entry, then keep gathering for up to max_wait
+        seconds (0 takes only what is already queued) until the batch is full.
+        Entries that arrive while waiting are merged into nondecreasing key
+        order before the batch is returned.
+        """
+        if max_items < 1:
+            raise ValueError("max_items must be at least 1")
+        batch = [await self.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + max_wait
+        while len(batch) < max_items:
+            if not self.is_empty():
+                batch.append(self.get_nowait())
+                continue
+            remaining = deadline - loop.time()
+            if remaining <= 0 or not await self._wait(self._getters, remaining):
+                break
+        batch.sort(key=itemgetter(0))  # late arrivals may beat earlier picks
+        return batch
+
+    def update(self, loc, newkey, newval):
+        """Re-prioritize a queued entry through the wrapped queue's update."""
+        self._pq.update(loc, newkey, newval)
+
+    def remove(self, loc):
+        """Remove and return a queued (k,v) pair through the wrapped queue's remove."""
+        item = self._pq.remove(loc)
+        self._wakeup_next(self._putters)
+        return item
@@ -0,0 +1,261 @@
+# Copyright 2013, Michael H. Goldwasser
+#
+# Developed for use with the book:
+#
+#    Data Structures and Algorithms in Python
+#    Michael T. Goodrich, Roberto Tamassia, and Michael H. Goldwasser
+#    John Wiley & Sons, 2013
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+from bisect import bisect_left, bisect_right
+from operator import itemgetter
+
+from priority_queue_base import PriorityQueueBase
+from exceptions import Empty
+
+
+class ChunkedSortedPriorityQueue(PriorityQueueBase):
+    """A min-oriented priority queue implemented with a list of sorted chunks.
+
+    Entries are kept in nondecreasing key order, split into chunks of at
+    most twice the load, each a pair of parallel key and value lists.  The
+    largest key of every chunk is indexed in _maxes, so an add bisects the
+    index and then one chunk, and its insert shifts at most one chunk.
+    Among equal keys, the one added first is removed first.
+    """
+
+    # ------------------------------ nonpublic behaviors ------------------------------
+    def _split(self, pos):
+        """Split chunk pos in two halves if it has grown past twice the load."""
+        keys = self._keys[pos]
+        if len(keys) > 2 * self._load:
+            values = self._values[pos]
+            half = len(keys) >> 1
+            self._keys.insert(pos + 1, keys[half:])
+            self._values.insert(pos + 1, values[half:])
+            del keys[half:]
+            del values[half:]
+            self._maxes.insert(pos, keys[-1])
+
+    def _delete(self, pos, j):
+        """Delete entry j of chunk pos, joining a small chunk to a neighbor."""
+        keys = self._keys[pos]
+        values = self._values[pos]
+        del keys[j]
+        del values[j]
+        self._size -= 1
+        if not keys:
+            del self._keys[pos], self._values[pos], self._maxes[pos]
+            return
+        self._maxes[pos] = keys[-1]
+        if len(keys) < self._load >> 1 and len(self._keys) > 1:
+            if pos == 0:
+                pos = 1  # join the next chunk into this one
+            self._keys[pos - 1].extend(self._keys[pos])
+            self._values[pos - 1].extend(self._values[pos])
+            self._maxes[pos - 1] = self._maxes[pos]
+            del self._keys[pos], self._values[pos], self._maxes[pos]
+            self._split(pos - 1)
+
+    def _extend(self, pairs):
+        """Append sorted (k,v) pairs with no key below the current maximum."""
+        load = self._load
+        start = 0
+        if self._keys and len(self._keys[-1]) < load:  # top up the last chunk first
+            start = load - len(self._keys[-1])
+            chunk = pairs[:start]
+            self._keys[-1].extend([k for k, _ in chunk])
+            self._values[-1].extend([v for _, v in chunk])
+            self._maxes[-1] = chunk[-1][0]
+        for j in range(start, len(pairs), load):
+            chunk = pairs[j : j + load]
+            self._keys.append([k for k, _ in chunk])
+            self._values.append([v for _, v in chunk])
+            self._maxes.append(chunk[-1][0])
+        self._size += len(pairs)
+
+    # ------------------------------ public behaviors ------------------------------
+    def __init__(self, load=1000):
+        """Create a new empty Priority Queue with chunks of about load entries."""
+        if load < 1:
+            raise ValueError("load must be at least 1")
+        self._load = load
+        self._keys = []  # one sorted list of keys per chunk
+        self._values = []  # parallel lists of values
+        self._maxes = []  # the last (largest) key of each chunk
+        self._size = 0
+
+    def __len__(self):
+        """Return the number of items in the priority queue."""
+        return self._size
+
+    def __iter__(self):
+        """Generate the (k,v) tuples in nondecreasing key order, without removal."""
+        for keys, values in zip(self._keys, self._values):
+            yield from zip(keys, values)
+
+    def add(self, key, value):
+        """Add a key-value pair."""
+        maxes = self._maxes
+        self._size += 1
+        if not maxes:
+            self._keys.append([key])
+            self._values.append([value])
+            maxes.append(key)
+            return
+        pos = bisect_right(maxes, key)  # first chunk with a larger key
+        if pos == len(maxes):  # no larger key: append to the last chunk
+            pos -= 1
+            self._keys[pos].append(key)
+            self._values[pos].append(value)
+            maxes[pos] = key
+        else:
+            keys = self._keys[pos]
+            j = bisect_right(keys, key)  # after equal keys, which were added earlier
+            keys.insert(j, key)
+            self._values[pos].insert(j, value)
+        self._split(pos)
+
+    def add_many(self, pairs):
+        """Add every (k,v) pair from an iterable, sorting the batch once.
+
+        A batch whose keys are no smaller than the current maximum is
+        appended as new chunks.  A small batch is added pair by pair; a
+        larger one is merged with every stored entry in O(n + m log m) time
+        and rechunked.  Equal keys keep the order in which they were added.
+        """
+        batch = sorted(pairs, key=itemgetter(0))  # stable for equal keys
+        if not batch:
+            return
+        if self._maxes and batch[0][0] < self._maxes[-1]:
+            if 10 * len(batch) < self._size:
+                for key, value in batch:
+                    self.add(key, value)
+                return
+            # timsort merges the two sorted runs in linear time, stored
+            # entries first so that they stay ahead of equal keys in the batch
+            batch = sorted([*self, *batch], key=itemgetter(0))
+            self._keys.clear()
+            self._values.clear()
+            self._maxes.clear()
+            self._size = 0
+        self._extend(batch)
+
+    def min(self):
+        """Return but do not remove (k,v) tuple with minimum key.
+
+        Raise Empty exception if empty.
+        """
+        if self.is_empty():
+            raise Empty("Priority queue is empty.")
+        return (self._keys[0][0], self._values[0][0])
+
+    def remove_min(self):
+        """Remove and return (k,v) tuple with minimum key.
+
+        Raise Empty exception if empty.
+        """
+        if self.is_empty():
+            raise Empty("Priority queue is empty.")
+        keys = self._keys[0]
+        values = self._values[0]
+        key = keys.pop(0)  # shifts at most one chunk
+        value = values.pop(0)
+        self._size -= 1
+        if not keys:
+            del self._keys[0], self._values[0], self._maxes[0]
+        return (key, value)
+
+    def remove(self, key, value):
+        """Remove and return the earliest added (k,v) tuple equal to the given pair.
+
+        Raise ValueError if no such pair is in the priority queue.
+        """
+        pos = bisect_left(self._maxes, key)  # first chunk that may hold key
+        while pos < len(self._maxes):
+            keys = self._keys[pos]
+            values = self._values[pos]
+            j = bisect_left(keys, key)
+            while j < len(keys) and not key < keys[j]:
+                if values[j] == value:
+                    pair = (keys[j], values[j])
+                    self._delete(pos, j)
+                    return pair
+                j += 1
+            if j < len(keys):  # passed the last equal key
+                break
+            pos += 1
+        raise ValueError("pair is not in the priority queue")
+
+    def remove_min_many(self, k):
+        """Remove and return a list of the k (k,v) tuples with smallest keys.
+
+        Tuples are listed in nondecreasing key order; fewer than k are
+        returned if the priority queue holds fewer than k items.
+        """
+        if k < 0:
+            raise ValueError("k must be nonnegative")
+        k = min(k, self._size)
+        self._size -= k
+        result = []
+        while k and len(self._keys[0]) <= k:  # whole chunks
+            keys = self._keys.pop(0)
+            result.extend(zip(keys, self._values.pop(0)))
+            del self._maxes[0]
+            k -= len(keys)
+        if k:
+            result.extend(zip(self._keys[0][:k], self._values[0][:k]))
+            del self._keys[0][:k], self._values[0][:k]
+        return result
+
+    def pop_while(self, predicate):
+        """Remove and return minimum (k,v) tuples for as long as predicate(k) holds.
+
+        Tuples are listed in nondecreasing key order.  predicate must hold
+        for a prefix of the key order: if it holds for a key, it holds for
+        every smaller key.
+        """
+        count = 0
+        pos = 0
+        while pos < len(self._maxes) and predicate(self._maxes[pos]):  # whole chunks
+            count += len(self._keys[pos])
+            pos += 1
+        if pos < len(self._maxes):
+            keys = self._keys[pos]
+            low, high = 0, len(keys)
+            while low < high:  # find the first failing key of the partial chunk
+                mid = (low + high) >> 1
+                if predicate(keys[mid]):
+                    low = mid + 1
+                else:
+                    high = mid
+            count += low
+        return self.remove_min_many(count)
+
+    def remove_until(self, threshold):
+        """Remove and return every (k,v) tuple with key no greater than threshold.
+
+        Tuples are listed in nondecreasing key order.
+        """
+        return self.pop_while(lambda key: not threshold < key)
+
+    def drain(self):
+        """Generate (k,v) tuples in nondecreasing key order until empty.
+
+        Each tuple is removed from the priority queue as it is generated.
+        """
+        while self._size:
+            yield self.remove_min()
@@ -0,0 +1,122 @@
+# Copyright 2013, Michael H. Goldwasser
+#
+# Developed for use with the book:
+#
+#    Data Structures and Algorithms in Python
+#    Michael T. Goodrich, Roberto Tamassia, and Michael H. Goldwasser
+#    John Wiley & Sons, 2013
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import itertools
+import random
+import threading
+
+from heap_priority_queue import HeapPriorityQueue
+from exceptions import Empty
+
+
+class ShardedPriorityQueue:
+    """A thread-safe priority queue spread over HeapPriorityQueue shards.
+
+    Each shard has its own lock, so producers putting into different
+    shards never contend.  A semaphore counts queued entries, letting
+    consumers block without polling.  In strict mode get locks every shard
+    and removes the global minimum; in relaxed mode it compares the
+    minima of two randomly chosen shards ("power of two choices") and
+    removes the smaller, which returns a near-minimal entry while touching
+    only two locks.
+    """
+
+    # ------------------------------ nonpublic behaviors ------------------------------
+    def _take_strict(self):
+        """Remove and return the global minimum (an entry is known to exist)."""
+        locks = self._locks
+        for lock in locks:  # always acquired in index order, so no deadlock
+            lock.acquire()
+        try:
+            best = None
+            for shard in self._shards:
+                if shard and (best is None or shard.min()[0] < best.min()[0]):
+                    best = shard
+            return best.remove_min()
+        finally:
+            for lock in locks:
+                lock.release()
+
+    def _take_relaxed(self):
+        """Remove and return a near-minimal entry (an entry is known to exist)."""
+        shards = self._shards
+        count = len(shards)
+        i, j = random.randrange(count), random.randrange(count)
+        with self._locks[i]:
+            first = shards[i].min()[0] if shards[i] else None
+        with self._locks[j]:
+            second = shards[j].min()[0] if shards[j] else None
+        if first is None or (second is not None and second < first):
+            i = j
+        start = i
+        while True:  # fall back to scanning if the chosen shard was emptied
+            with self._locks[i]:
+                if shards[i]:
+                    return shards[i].remove_min()
+            i = (i + 1) % count
+            if i == start:
+                i = start = random.randrange(count)
+
+    # ------------------------------ public behaviors ------------------------------
+    def __init__(self, shards=4, strict=True):
+        """Create a new empty queue with the given number of shards."""
+        if shards < 1:
+            raise ValueError("shards must be at least 1")
+        self._shards = [HeapPriorityQueue() for _ in range(shards)]
+        self._locks = [threading.Lock() for _ in range(shards)]
+        self._available = threading.Semaphore(0)  # one permit per queued entry
+        self._strict = strict
+        self._next_shard = itertools.count()  # round-robin placement of puts
+
+    def __len__(self):
+        """Return the number of queued entries (a snapshot under concurrency)."""
+        return sum(len(shard) for shard in self._shards)
+
+    def is_empty(self):
+        """Return True if no entries are queued (a snapshot under concurrency)."""
+        return len(self) == 0
+
+    def put(self, key, value):
+        """Add a key-value pair without blocking."""
+        i = next(self._next_shard) % len(self._shards)
+        with self._locks[i]:
+            self._shards[i].add(key, value)
+        self._available.release()
+
+    def get(self, block=True, timeout=None):
+        """Remove and return a (k,v) tuple, the minimum one in strict mode.
+
+        If block is true, wait up to timeout seconds (forever if None) for
+        an entry to arrive; otherwise timeout is ignored, as in queue.Queue.
+        Raise Empty exception if none is available.
+        """
+        if not block:
+            timeout = None  # Semaphore.acquire rejects a timeout when not blocking
+        if not self._available.acquire(block, timeout):
+            raise Empty("Priority queue is empty.")
+        return self._take_strict() if self._strict else self._take_relaxed()
+
+    def get_nowait(self):
+        """Remove and return a (k,v) tuple without blocking.
+
+        Raise Empty exception if none is available.
+        """
+        return self.get(block=False)
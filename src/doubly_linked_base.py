@@ -75,3 +75,17 @@ class _DoublyLinkedBase:
         element = node._element  # record deleted element
         node._prev = node._next = node._element = None  # deprecate node
         return element  # return deleted element
+
+    def _delete_run(self, predecessor, k):
+        """Delete the k nodes following predecessor and return their elements."""
+        elements = []
+        walk = predecessor._next
+        for _ in range(k):
+            elements.append(walk._element)
+            successor = walk._next
+            walk._prev = walk._next = walk._element = None  # deprecate node
+            walk = successor
+        predecessor._next = walk  # splice the run out with a single relink
+        walk._prev = predecessor
+        self._size -= k
+        return elements
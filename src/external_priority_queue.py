@@ -0,0 +1,251 @@
+# Copyright 2013, Michael H. Goldwasser
+#
+# Developed for use with the book:
+#
+#    Data Structures and Algorithms in Python
+#    Michael T. Goodrich, Roberto Tamassia, and Michael H. Goldwasser
+#    John Wiley & Sons, 2013
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+import pickle
+import sys
+import tempfile
+
+from heap_priority_queue import HeapPriorityQueue
+from exceptions import Empty
+
+
+class ExternalPriorityQueue:
+    """A min-oriented priority queue that spills to disk past a memory budget.
+
+    New entries go to an in-memory HeapPriorityQueue.  When its estimated
+    size exceeds the byte budget, its contents are written out in sorted
+    order as a run in a temporary file, and the heap starts over empty.
+    remove_min lazily k-way merges the heads of all runs with the heap,
+    reading each run sequentially one block at a time.  Once more than
+    fan_in runs are open, the oldest are merged into a single run so that
+    open files stay bounded.
+
+    The budget covers the in-memory heap only.  Each open run also holds
+    an I/O buffer of buffering bytes and one decoded block of _BLOCK
+    entries, so peak memory is about budget + fan_in * (buffering + block).
+
+    Keys and values must be picklable.
+    """
+
+    _ENTRY_OVERHEAD = 64  # _Item with __slots__ plus its slot in the heap list
+    _BLOCK = 256  # entries per pickled block; each open run holds one in memory
+
+    # ------------------------------ nested _Run class ------------------------------
+    class _Run:
+        """Sequential reader over one sorted run spilled to a temporary file."""
+
+        __slots__ = "_file", "_block", "_pos", "_remaining"
+
+        def __init__(self, fileobj, count):
+            self._file = fileobj
+            self._block = []
+            self._pos = 0
+            self._remaining = count  # entries not yet returned
+
+        def head(self):
+            """Return the next (k,v) tuple of the run without consuming it."""
+            if self._pos == len(self._block):
+                self._block = pickle.load(self._file)
+                self._pos = 0
+            return self._block[self._pos]
+
+        def advance(self):
+            """Consume the head; return False once the run is exhausted."""
+            self._pos += 1
+            self._remaining -= 1
+            if self._remaining == 0:
+                self._file.close()  # deletes the temporary file
+                return False
+            return True
+
+    # ------------------------------ nonpublic behaviors ------------------------------
+    def _size(self, key, value):
+        return sys.getsizeof(key) + sys.getsizeof(value) + self._ENTRY_OVERHEAD
+
+    def _write_run(self, pairs, count):
+        """Write count (k,v) tuples, given in key order, to a new _Run."""
+        fileobj = tempfile.TemporaryFile(dir=self._tmpdir, buffering=self._buffering)
+        chunk = []
+        for pair in pairs:
+            chunk.append(pair)
+            if len(chunk) == self._BLOCK:
+                pickle.dump(chunk, fileobj, pickle.HIGHEST_PROTOCOL)
+                chunk = []
+        if chunk:
+            pickle.dump(chunk, fileobj, pickle.HIGHEST_PROTOCOL)
+        self._bytes_spilled += fileobj.tell()
+        fileobj.seek(0)
+        return self._Run(fileobj, count)
+
+    def _merged(self, runs):
+        """Generate the remaining (k,v) tuples of the given runs in key order."""
+        heads = HeapPriorityQueue()
+        for run in runs:
+            heads.add(run.head()[0], run)
+        while not heads.is_empty():
+            run = heads.min()[1]
+            yield run.head()
+            if run.advance():
+                heads.replace_min(run.head()[0], run)
+            else:
+                heads.remove_min()
+
+    def _merge_oldest(self):
+        """Merge the oldest open runs into one, leaving fan_in // 2 + 1 open."""
+        self._open = [run for run in self._open if run._remaining]
+        cut = len(self._open) - self._fan_in // 2
+        oldest = self._open[:cut]
+        count = sum(run._remaining for run in oldest)
+        merged = self._write_run(self._merged(oldest), count)
+        self._open[:cut] = [merged]
+        self._runs = HeapPriorityQueue()
+        for run in self._open:
+            self._runs.add(run.head()[0], run)
+        self._merges += 1
+
+    def _spill(self):
+        """Write the in-memory heap out as a sorted run and empty it."""
+        pairs = self._hot.remove_min_many(len(self._hot))  # sorted, heap left empty
+        run = self._write_run(pairs, len(pairs))
+        self._open.append(run)
+        self._runs.add(run.head()[0], run)
+        self._runs_spilled += 1
+        self._entries_spilled += len(pairs)
+        self._on_disk += len(pairs)
+        self._hot_bytes = 0
+        if len(self._runs) > self._fan_in:
+            self._merge_oldest()
+
+    def _from_run(self):
+        """Return True if the minimum entry is the head of a spilled run."""
+        if self._runs.is_empty():
+            return False
+        if self._hot.is_empty():
+            return True
+        return not self._hot.min()[0] < self._runs.min()[0]
+
+    # ------------------------------ public behaviors ------------------------------
+    def __init__(self, budget=64 * 2**20, tmpdir=None, buffering=2**16, fan_in=64):
+        """Create a new empty Priority Queue.
+
+        budget     estimated bytes the in-memory heap may hold before spilling
+        tmpdir     directory for run files (default: the system temp dir)
+        buffering  I/O buffer size in bytes for each run file
+        fan_in     most runs kept open before the oldest are merged
+        """
+        if budget <= 0:
+            raise ValueError("budget must be positive")
+        if fan_in < 2:
+            raise ValueError("fan_in must be at least 2")
+        self._budget = budget
+        self._tmpdir = tmpdir
+        self._buffering = buffering
+        self._fan_in = fan_in
+        self._hot = HeapPriorityQueue()
+        self._hot_bytes = 0
+        self._runs = HeapPriorityQueue()  # (head key, _Run) for each open run
+        self._open = []  # runs in the order written; may include exhausted ones
+        self._on_disk = 0  # entries still unread in open runs
+        self._runs_spilled = 0
+        self._entries_spilled = 0
+        self._bytes_spilled = 0
+        self._merges = 0
+
+    def __len__(self):
+        """Return the number of items in the priority queue."""
+        return len(self._hot) + self._on_disk
+
+    def is_empty(self):
+        """Return True if the priority queue is empty."""
+        return len(self) == 0
+
+    def add(self, key, value):
+        """Add a key-value pair, spilling to disk if the budget is exceeded."""
+        self._hot.add(key, value)
+        self._hot_bytes += self._size(key, value)
+        if self._hot_bytes > self._budget:
+            self._spill()
+
+    def min(self):
+        """Return but do not remove (k,v) tuple with minimum key.
+
+        Raise Empty exception if empty.
+        """
+        if self.is_empty():
+            raise Empty("Priority queue is empty.")
+        if self._from_run():
+            return self._runs.min()[1].head()
+        return self._hot.min()
+
+    def remove_min(self):
+        """Remove and return (k,v) tuple with minimum key.
+
+        Raise Empty exception if empty.
+        """
+        if self.is_empty():
+            raise Empty("Priority queue is empty.")
+        if not self._from_run():
+            key, value = self._hot.remove_min()
+            self._hot_bytes -= self._size(key, value)
+            return (key, value)
+        run = self._runs.min()[1]
+        pair = run.head()
+        if run.advance():
+            self._runs.replace_min(run.head()[0], run)
+        else:
+            self._runs.remove_min()
+        self._on_disk -= 1
+        return pair
+
+    def spill_stats(self):
+        """Return a dict describing the runs spilled to disk so far.
+
+        runs             runs spilled from memory since creation
+        open_runs        runs with entries still unread
+        merges           times the oldest open runs were merged into one
+        entries_spilled  entries spilled from memory to runs
+        bytes_spilled    bytes written to run files, merged runs included
+        entries_on_disk  entries still unread in open runs
+        """
+        return {
+            "runs": self._runs_spilled,
+            "open_runs": len(self._runs),
+            "merges": self._merges,
+            "entries_spilled": self._entries_spilled,
+            "bytes_spilled": self._bytes_spilled,
+            "entries_on_disk": self._on_disk,
+        }
+
+    def close(self):
+        """Discard all entries and delete any remaining run files."""
+        while not self._runs.is_empty():
+            self._runs.remove_min()[1]._file.close()
+        self._open = []
+        self._on_disk = 0
+        self._hot = HeapPriorityQueue()
+        self._hot_bytes = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
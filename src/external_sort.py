@@ -0,0 +1,126 @@
+# Copyright 2013, Michael H. Goldwasser
+#
+# Developed for use with the book:
+#
+#    Data Structures and Algorithms in Python
+#    Michael T. Goodrich, Roberto Tamassia, and Michael H. Goldwasser
+#    John Wiley & Sons, 2013
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+"""Streaming k-way merge and a file-level external sort built on it."""
+
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+from heap_priority_queue import HeapPriorityQueue
+
+
+def merge_sorted(iterables, key=None):
+    """Generate the elements of several sorted iterables in one sorted stream.
+
+    Each iterable must already be sorted by key (the identity if None).
+    Elements with equal keys come out in the order of their iterables, so
+    the merge is stable.  The heap holds one head per unfinished iterable,
+    and each step is a single pushpop: an iterable whose next element is
+    still the smallest is consumed without touching the heap.
+    """
+    pq = HeapPriorityQueue()
+    for j, iterable in enumerate(iterables):
+        it = iter(iterable)
+        for first in it:  # skip empty iterables
+            pq.add((first if key is None else key(first), j), (first, it))
+            break
+    if pq.is_empty():
+        return
+    (_, j), (element, it) = pq.remove_min()
+    while True:
+        yield element
+        for element in it:
+            k = element if key is None else key(element)
+            (_, j), (element, it) = pq.pushpop((k, j), (element, it))
+            break
+        else:  # the iterable just yielded from is exhausted
+            if pq.is_empty():
+                return
+            (_, j), (element, it) = pq.remove_min()
+
+
+def _chunk_bounds(path, run_bytes):
+    """Return (start, end) byte ranges of path, each ending on a line boundary."""
+    bounds = []
+    size = os.path.getsize(path)
+    with open(path, "rb") as fileobj:
+        start = 0
+        while start < size:
+            fileobj.seek(min(start + run_bytes, size))
+            fileobj.readline()  # extend to the end of the current line
+            end = min(fileobj.tell(), size)
+            bounds.append((start, end))
+            start = end
+    return bounds
+
+
+def _sort_run(path, start, end, run_path, key):
+    """Sort the lines of path in [start, end) and write them to run_path."""
+    with open(path, "rb") as fileobj:
+        fileobj.seek(start)
+        lines = fileobj.read(end - start).splitlines(keepends=True)
+    if lines and not lines[-1].endswith(b"\n"):
+        lines[-1] += b"\n"  # a final line without newline must not fuse when merged
+    lines.sort(key=key)
+    with open(run_path, "wb") as fileobj:
+        fileobj.writelines(lines)
+    return run_path
+
+
+def sort_file(
+    path, out_path, key=None, run_bytes=64 * 2**20, workers=None, buffering=2**20
+):
+    """Sort the lines of the file at path into out_path; return the number of runs.
+
+    The input is split into runs of about run_bytes, each sorted in memory
+    by a pool of worker processes (in this process if workers is 0) and
+    written to a temporary file.  The runs are then streamed through
+    merge_sorted using readers and a writer with buffering bytes of buffer.
+    Lines are compared as bytes, or by key(line), which must be picklable
+    when workers is not 0.  The output always ends with a newline.
+    """
+    bounds = _chunk_bounds(path, run_bytes)
+    with tempfile.TemporaryDirectory(
+        dir=os.path.dirname(os.path.abspath(out_path))
+    ) as tmpdir:
+        jobs = [
+            (path, start, end, os.path.join(tmpdir, "run{0}".format(j)), key)
+            for j, (start, end) in enumerate(bounds)
+        ]
+        if workers == 0 or len(jobs) <= 1:
+            run_paths = [_sort_run(*job) for job in jobs]
+        else:
+            with ProcessPoolExecutor(workers) as pool:
+                run_paths = list(pool.map(_sort_run, *zip(*jobs)))
+        if len(run_paths) == 1:  # already fully sorted
+            shutil.move(run_paths[0], out_path)
+            return 1
+        runs = [open(run_path, "rb", buffering=buffering) for run_path in run_paths]
+        try:
+            with open(out_path, "wb", buffering=buffering) as out:
+                out.writelines(merge_sorted(runs, key))
+        finally:
+            for run in runs:
+                run.close()
+    return len(run_paths)
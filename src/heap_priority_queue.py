@@ -19,22 +19,26 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+from array import array
+from operator import attrgetter
+
 from priority_queue_base import PriorityQueueBase
 from exceptions import Empty
+from heap_snapshot import key_typecode, read_snapshot, write_snapshot
 
 
 class HeapPriorityQueue(PriorityQueueBase):  # base class defines _Item
-    """A min-oriented priority queue implemented with a binary heap."""
+    """A min-oriented priority queue implemented with a d-ary heap (binary by default)."""
 
     # ------------------------------ nonpublic behaviors ------------------------------
     def _parent(self, j):
-        return (j - 1) // 2
+        return (j - 1) // self._arity
 
     def _left(self, j):
-        return 2 * j + 1
+        return self._arity * j + 1  # first of the arity children of j
 
     def _right(self, j):
-        return 2 * j + 2
+        return self._arity * j + 2  # second child, the right one when binary
 
     def _has_left(self, j):
         return self._left(j) < len(self._data)  # index beyond end of list?
@@ -47,28 +51,120 @@ class HeapPriorityQueue(PriorityQueueBase):  # base class defines _Item
         self._data[i], self._data[j] = self._data[j], self._data[i]
 
     def _upheap(self, j):
-        parent = self._parent(j)
-        if j > 0 and self._data[j] < self._data[parent]:
-            self._swap(j, parent)
-            self._upheap(parent)  # recur at position of parent
+        """Move the item at index j up until its parent is no larger.
+
+        The item is lifted out, leaving a hole that climbs while larger
+        parents are shifted down into it, and is written back once at the end.
+        """
+        data = self._data
+        d = self._arity
+        item = data[j]
+        key = item._key
+        while j > 0:
+            parent = (j - 1) // d
+            above = data[parent]
+            if not key < above._key:
+                break
+            data[j] = above  # shift parent down into the hole
+            j = parent
+        data[j] = item
 
     def _downheap(self, j):
-        if self._has_left(j):
-            left = self._left(j)
-            small_child = left  # although right may be smaller
-            if self._has_right(j):
-                right = self._right(j)
-                if self._data[right] < self._data[left]:
-                    small_child = right
-            if self._data[small_child] < self._data[j]:
-                self._swap(j, small_child)
-                self._downheap(small_child)  # recur at position of small child
+        """Move the item at index j down until no child is smaller.
+
+        The hole descends along the path of smallest children, the leftmost
+        winning ties, exactly as with repeated swaps.
+        """
+        data = self._data
+        n = len(data)
+        d = self._arity
+        item = data[j]
+        key = item._key
+        child = d * j + 1
+        while child < n:
+            small = data[child]
+            if d == 2:
+                right = child + 1
+                if right < n and data[right]._key < small._key:
+                    child = right
+                    small = data[right]
+            else:
+                small_key = small._key
+                for c in range(child + 1, min(child + d, n)):  # scan siblings
+                    other = data[c]
+                    if other._key < small_key:
+                        child, small, small_key = c, other, other._key
+            if not small._key < key:
+                break
+            data[j] = small  # shift smallest child up into the hole
+            j = child
+            child = d * j + 1
+        data[j] = item
+
+    def _heapify(self):
+        """Restore the heap property over the whole array in O(n) time."""
+        last_parent = self._parent(len(self._data) - 1)
+        for j in range(last_parent, -1, -1):  # bottom-up, ending at the root
+            self._downheap(j)
+
+    def _repair_tail(self, start):
+        """Restore the heap property after items were appended from index start.
+
+        A batch at least as large as the existing heap is restored with one
+        bottom-up heapify; smaller batches are upheaped one item at a time.
+        """
+        n = len(self._data)
+        if n - start >= start:
+            self._heapify()
+        else:
+            for j in range(start, n):
+                self._upheap(j)
+
+    def _remove_sorted_prefix(self, k):
+        """Sort the array by key, then remove and return its first k items.
+
+        The sorted remainder is left in place, as it is also a valid heap.
+        """
+        data = self._data
+        data.sort(key=attrgetter("_key"))
+        batch = data[:k]
+        del data[:k]
+        return batch
+
+    def _remove_indices(self, indices):
+        """Remove and return the items at the given indices, then heapify the rest."""
+        data = self._data
+        batch = [data[j] for j in indices]
+        for j in indices:
+            data[j] = None
+        data[:] = [item for item in data if item is not None]  # rebuild in place
+        self._heapify()
+        return batch
+
+    def _restore(self, keys, values):
+        """Replace the contents with a heap array given as parallel keys and values."""
+        self._data = list(map(self._Item, keys, values))
 
     # ------------------------------ public behaviors ------------------------------
-    def __init__(self):
-        """Create a new empty Priority Queue."""
+    def __init__(self, arity=2):
+        """Create a new empty Priority Queue.
+
+        Each node of the heap has up to arity children; wider nodes make
+        shallower trees, shortening upheap paths at the cost of comparing
+        more siblings per level of a downheap.
+        """
+        if not isinstance(arity, int) or arity < 2:
+            raise ValueError("arity must be an integer of at least 2")
+        self._arity = arity
         self._data = []
 
+    @classmethod
+    def from_items(cls, pairs, arity=2):
+        """Create a Priority Queue from an iterable of (k,v) pairs in O(n) time."""
+        pq = cls(arity)
+        pq.add_all(pairs)
+        return pq
+
     def __len__(self):
         """Return the number of items in the priority queue."""
         return len(self._data)
@@ -78,6 +174,19 @@ class HeapPriorityQueue(PriorityQueueBase):  # base class defines _Item
         self._data.append(self._Item(key, value))
         self._upheap(len(self._data) - 1)  # upheap newly added position
 
+    def add_all(self, pairs):
+        """Add every (k,v) pair from an iterable to the priority queue."""
+        start = len(self._data)
+        Item = self._Item
+        self._data.extend([Item(k, v) for k, v in pairs])
+        self._repair_tail(start)
+
+    def add_array(self, keys, values):
+        """Add the pairs formed by two equal-length sequences of keys and values."""
+        if len(keys) != len(values):
+            raise ValueError("keys and values must have the same length")
+        return self.add_all(zip(keys, values))
+
     def min(self):
         """Return but do not remove (k,v) tuple with minimum key.
 
@@ -95,7 +204,127 @@ class HeapPriorityQueue(PriorityQueueBase):  # base class defines _Item
         """
         if self.is_empty():
             raise Empty("Priority queue is empty.")
-        self._swap(0, len(self._data) - 1)  # put minimum item at the end
-        item = self._data.pop()  # and remove it from the list;
-        self._downheap(0)  # then fix new root
+        data = self._data
+        last = data.pop()  # remove the final item from the list;
+        if data:
+            item = data[0]  # it replaces the minimum at the root
+            data[0] = last
+            self._downheap(0)  # then fix new root
+        else:
+            item = last
+        return (item._key, item._value)
+
+    def pushpop(self, key, value):
+        """Add a key-value pair, then remove and return the (k,v) tuple with minimum key.
+
+        The new pair is returned untouched, without entering the heap, if
+        its key is no larger than the current minimum.
+        """
+        data = self._data
+        if not data or not data[0]._key < key:
+            return (key, value)
+        item = data[0]
+        data[0] = self._Item(key, value)  # new item takes the root's place
+        self._downheap(0)
+        return (item._key, item._value)
+
+    def replace_min(self, key, value):
+        """Remove and return the (k,v) tuple with minimum key, then add a key-value pair.
+
+        Raise Empty exception if empty.
+        """
+        if self.is_empty():
+            raise Empty("Priority queue is empty.")
+        data = self._data
+        item = data[0]
+        data[0] = self._Item(key, value)  # new item takes the root's place
+        self._downheap(0)
         return (item._key, item._value)
+
+    def remove_min_many(self, k):
+        """Remove and return a list of the k (k,v) tuples with smallest keys.
+
+        Tuples are listed in nondecreasing key order; fewer than k are
+        returned if the priority queue holds fewer than k items.
+        """
+        if k < 0:
+            raise ValueError("k must be nonnegative")
+        data = self._data
+        n = len(data)
+        k = min(k, n)
+        if 10 * k >= n:  # large batch: one C-level sort beats k sifts
+            batch = self._remove_sorted_prefix(k)
+            return [(item._key, item._value) for item in batch]
+        result = []
+        for _ in range(k):
+            last = data.pop()
+            item = data[0]  # k < n, so the heap is never emptied here
+            data[0] = last
+            self._downheap(0)
+            result.append((item._key, item._value))
+        return result
+
+    def pop_while(self, predicate):
+        """Remove and return minimum (k,v) tuples for as long as predicate(k) holds.
+
+        Tuples are listed in nondecreasing key order.  predicate must hold
+        for a prefix of the key order: if it holds for a key, it holds for
+        every smaller key.
+        """
+        data = self._data
+        d = self._arity
+        n = len(data)
+        found = []
+        stack = [0] if data and predicate(data[0]._key) else []
+        while stack:  # pruned DFS: below a failing node, every key fails too
+            j = stack.pop()
+            found.append(j)
+            first = d * j + 1
+            for child in range(first, min(first + d, n)):
+                if predicate(data[child]._key):
+                    stack.append(child)
+        if 10 * len(found) < n:  # small batch: sift out one root at a time
+            return self.remove_min_many(len(found))
+        batch = self._remove_indices(found)
+        batch.sort(key=attrgetter("_key"))
+        return [(item._key, item._value) for item in batch]
+
+    def remove_until(self, threshold):
+        """Remove and return every (k,v) tuple with key no greater than threshold.
+
+        Tuples are listed in nondecreasing key order.
+        """
+        return self.pop_while(lambda key: not threshold < key)
+
+    def drain(self):
+        """Generate (k,v) tuples in nondecreasing key order until empty.
+
+        Each tuple is removed from the priority queue as it is generated.
+        """
+        while not self.is_empty():
+            yield self.remove_min()
+
+    def dump(self, fileobj):
+        """Write the contents to a binary file object, keeping the heap order.
+
+        Keys that are all floats, or all 64-bit integers, are written as one
+        contiguous typed block; other keys, and all values, are pickled.
+        """
+        data = self._data
+        keys = [item._key for item in data]
+        typecode = key_typecode(keys)
+        if typecode != "O":
+            keys = array(typecode, keys)
+        values = [item._value for item in data]
+        write_snapshot(fileobj, self._arity, typecode, keys, values)
+
+    @classmethod
+    def load(cls, fileobj):
+        """Create a Priority Queue from a snapshot written by dump.
+
+        The stored heap order is reused as is, so no heapify is needed.
+        """
+        arity, typecode, keys, values = read_snapshot(fileobj)
+        pq = cls(arity)
+        pq._restore(keys, values)
+        return pq
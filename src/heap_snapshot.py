@@ -0,0 +1,128 @@
+# Copyright 2013, Michael H. Goldwasser
+#
+# Developed for use with the book:
+#
+#    Data Structures and Algorithms in Python
+#    Michael T. Goodrich, Roberto Tamassia, and Michael H. Goldwasser
+#    John Wiley & Sons, 2013
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+"""Compact binary snapshots shared by the heap-based priority queues.
+
+A snapshot stores a heap array in its existing order:
+
+    header   magic, arity, key typecode, byte order, entry count (20 bytes)
+    keys     one contiguous array of the typecode, or for typecode 'O'
+             a length-prefixed pickle of the key list
+    values   a length-prefixed pickle of the value list
+
+Since the order is preserved, a loaded heap needs no re-heapify, and
+the key block is read straight into the buffer of the new array.
+"""
+
+import pickle
+import struct
+import sys
+from array import array
+
+_MAGIC = b"PQH2"
+_HEADER = struct.Struct("<4sIcc2xQ")
+_LENGTH = struct.Struct("<Q")
+_BYTEORDER = {"little": b"<", "big": b">"}
+
+
+def key_typecode(keys):
+    """Return the array typecode able to hold every key exactly, or 'O' if none."""
+    kinds = set(map(type, keys))
+    if kinds <= {float}:
+        return "d"
+    if kinds == {int}:
+        try:
+            array("q", keys)
+        except OverflowError:
+            return "O"
+        return "q"
+    return "O"
+
+
+def _write_section(fileobj, obj):
+    data = pickle.dumps(obj, pickle.HIGHEST_PROTOCOL)
+    fileobj.write(_LENGTH.pack(len(data)))
+    fileobj.write(data)
+
+
+def _read_section(fileobj):
+    prefix = fileobj.read(_LENGTH.size)
+    if len(prefix) != _LENGTH.size:
+        raise ValueError("truncated priority queue snapshot")
+    (length,) = _LENGTH.unpack(prefix)
+    data = fileobj.read(length)
+    if len(data) != length:
+        raise ValueError("truncated priority queue snapshot")
+    return pickle.loads(data)
+
+
+def write_snapshot(fileobj, arity, typecode, keys, values):
+    """Write a heap array of keys and values to a binary file object.
+
+    keys must be an array of the given typecode, or any list for 'O'.
+    """
+    if not arity < 2**32:
+        raise ValueError("arity {0} is too large for a snapshot".format(arity))
+    byteorder = _BYTEORDER[sys.byteorder]
+    header = _HEADER.pack(_MAGIC, arity, typecode.encode(), byteorder, len(values))
+    fileobj.write(header)
+    if typecode == "O":
+        _write_section(fileobj, list(keys))
+    else:
+        fileobj.write(keys)  # the array's buffer, without an intermediate copy
+    _write_section(fileobj, values)
+
+
+def _read_keys(fileobj, typecode, count):
+    """Return an array of count keys read from the current position."""
+    keys = array(typecode, [0]) * count
+    with memoryview(keys) as view, view.cast("B") as block:
+        filled = 0
+        while filled < len(block):  # pipes and sockets may return short reads
+            n = fileobj.readinto(block[filled:])
+            if not n:
+                raise ValueError("truncated priority queue snapshot")
+            filled += n
+    return keys
+
+
+def read_snapshot(fileobj):
+    """Read a snapshot and return (arity, typecode, keys, values).
+
+    keys is an array for typed keys and a list for typecode 'O'.
+    Raise ValueError if the file object does not hold a snapshot.
+    """
+    header = fileobj.read(_HEADER.size)
+    if len(header) != _HEADER.size or header[:4] != _MAGIC:
+        raise ValueError("not a priority queue snapshot")
+    _, arity, typecode, byteorder, count = _HEADER.unpack(header)
+    typecode = typecode.decode()
+    if typecode == "O":
+        keys = _read_section(fileobj)
+    else:
+        keys = _read_keys(fileobj, typecode, count)
+        if byteorder != _BYTEORDER[sys.byteorder]:
+            keys.byteswap()
+    values = _read_section(fileobj)
+    if len(keys) != count or len(values) != count:
+        raise ValueError("truncated priority queue snapshot")
+    return arity, typecode, keys, values
@@ -0,0 +1,178 @@
+# Copyright 2013, Michael H. Goldwasser
+#
+# Developed for use with the book:
+#
+#    Data Structures and Algorithms in Python
+#    Michael T. Goodrich, Roberto Tamassia, and Michael H. Goldwasser
+#    John Wiley & Sons, 2013
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from array import array
+
+from priority_queue_base import PriorityQueueBase
+from exceptions import Empty
+
+
+class IndexedHeapPriorityQueue(PriorityQueueBase):
+    """An adaptable binary heap whose entries are identified by integer handles.
+
+    Each entry's value is its handle, a nonnegative int such as a vertex
+    id, and plays the role of a Locator.  The heap stores handles in a flat
+    array, a second array maps each handle to its heap index (-1 if
+    absent), and keys are kept in a list indexed by handle, so locating
+    an entry is a single lookup and no per-entry object is allocated.
+    """
+
+    # ------------------------------ nonpublic behaviors ------------------------------
+    def _upheap(self, j):
+        heap = self._heap
+        pos = self._pos
+        keys = self._keys
+        handle = heap[j]
+        key = keys[handle]
+        while j > 0:
+            parent = (j - 1) >> 1
+            above = heap[parent]
+            if not key < keys[above]:
+                break
+            heap[j] = above  # shift parent down into the hole
+            pos[above] = j
+            j = parent
+        heap[j] = handle
+        pos[handle] = j
+
+    def _downheap(self, j):
+        heap = self._heap
+        pos = self._pos
+        keys = self._keys
+        n = len(heap)
+        handle = heap[j]
+        key = keys[handle]
+        child = 2 * j + 1
+        while child < n:
+            small = heap[child]
+            right = child + 1
+            if right < n and keys[heap[right]] < keys[small]:
+                child = right
+                small = heap[right]
+            if not keys[small] < key:
+                break
+            heap[j] = small  # shift smaller child up into the hole
+            pos[small] = j
+            j = child
+            child = 2 * j + 1
+        heap[j] = handle
+        pos[handle] = j
+
+    def _bubble(self, j):
+        if j > 0 and self._keys[self._heap[j]] < self._keys[self._heap[(j - 1) >> 1]]:
+            self._upheap(j)
+        else:
+            self._downheap(j)
+
+    def _validate(self, handle):
+        """Return the heap index of handle, or raise ValueError if absent."""
+        if not (0 <= handle < len(self._pos) and self._pos[handle] >= 0):
+            raise ValueError("Invalid handle")
+        return self._pos[handle]
+
+    def _reserve(self, handle):
+        """Grow the index table so that it covers handle."""
+        grow = max(handle + 1, 2 * len(self._pos)) - len(self._pos)
+        self._pos.extend(array("l", [-1]) * grow)
+        self._keys.extend([None] * grow)
+
+    # ------------------------------ public behaviors ------------------------------
+    def __init__(self, capacity=0):
+        """Create a new empty Priority Queue with room for handles below capacity."""
+        self._heap = array("l")  # handles in heap order
+        self._pos = array("l", [-1]) * capacity  # heap index of each handle
+        self._keys = [None] * capacity  # key of each handle
+
+    def __len__(self):
+        """Return the number of items in the priority queue."""
+        return len(self._heap)
+
+    def __contains__(self, handle):
+        """Return True if handle identifies an entry of the priority queue."""
+        return 0 <= handle < len(self._pos) and self._pos[handle] >= 0
+
+    def add(self, key, handle):
+        """Add an entry with the given key, identified by integer handle.
+
+        Raise ValueError if handle is negative or already in use.
+        """
+        if handle < 0:
+            raise ValueError("handle must be nonnegative")
+        if handle >= len(self._pos):
+            self._reserve(handle)
+        elif self._pos[handle] >= 0:
+            raise ValueError("handle {0} is already in use".format(handle))
+        self._keys[handle] = key
+        self._heap.append(handle)
+        self._upheap(len(self._heap) - 1)
+        return handle
+
+    def key(self, handle):
+        """Return the key of the entry identified by handle."""
+        self._validate(handle)
+        return self._keys[handle]
+
+    def min(self):
+        """Return but do not remove (k,handle) tuple with minimum key.
+
+        Raise Empty exception if empty.
+        """
+        if self.is_empty():
+            raise Empty("Priority queue is empty.")
+        handle = self._heap[0]
+        return (self._keys[handle], handle)
+
+    def remove_min(self):
+        """Remove and return (k,handle) tuple with minimum key.
+
+        Raise Empty exception if empty.
+        """
+        if self.is_empty():
+            raise Empty("Priority queue is empty.")
+        return self.remove(self._heap[0])
+
+    def update(self, handle, newkey):
+        """Change the key of the entry identified by handle."""
+        j = self._validate(handle)
+        self._keys[handle] = newkey
+        self._bubble(j)
+
+    def decrease_key(self, handle, newkey):
+        """Lower the key of the entry identified by handle to newkey."""
+        j = self._validate(handle)
+        if self._keys[handle] < newkey:
+            raise ValueError("new key must not be larger than the current key")
+        self._keys[handle] = newkey
+        self._upheap(j)
+
+    def remove(self, handle):
+        """Remove and return the (k,handle) pair identified by handle."""
+        j = self._validate(handle)
+        heap = self._heap
+        last = heap.pop()
+        if last != handle:  # move the final entry into the vacated slot
+            heap[j] = last
+            self._pos[last] = j
+            self._bubble(j)
+        self._pos[handle] = -1
+        key = self._keys[handle]
+        self._keys[handle] = None  # release the key object
+        return (key, handle)
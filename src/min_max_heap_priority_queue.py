@@ -0,0 +1,209 @@
+# Copyright 2013, Michael H. Goldwasser
+#
+# Developed for use with the book:
+#
+#    Data Structures and Algorithms in Python
+#    Michael T. Goodrich, Roberto Tamassia, and Michael H. Goldwasser
+#    John Wiley & Sons, 2013
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from priority_queue_base import PriorityQueueBase
+from exceptions import Empty
+
+
+class MinMaxHeapPriorityQueue(PriorityQueueBase):  # base class defines _Item
+    """A double-ended priority queue implemented with a min-max heap.
+
+    Nodes on even levels (the root's included) are no larger than their
+    descendants and nodes on odd levels no smaller, so the minimum sits
+    at the root and the maximum at one of its children.  An optional
+    capacity makes add evict the entry with maximum key when full.
+    """
+
+    # ------------------------------ nonpublic behaviors ------------------------------
+    def _is_min_level(self, j):
+        return (j + 1).bit_length() & 1 == 1  # depth floor(log2(j+1)) is even
+
+    def _swap(self, i, j):
+        """Swap the elements at indices i and j of array."""
+        self._data[i], self._data[j] = self._data[j], self._data[i]
+
+    def _upheap(self, j):
+        """Move the item at index j up along its min or max levels."""
+        data = self._data
+        if j == 0:
+            return
+        parent = (j - 1) >> 1
+        if self._is_min_level(j):
+            if data[parent]._key < data[j]._key:  # belongs among the max levels
+                self._swap(j, parent)
+                j, smaller_first = parent, False
+            else:
+                smaller_first = True
+        elif data[j]._key < data[parent]._key:  # belongs among the min levels
+            self._swap(j, parent)
+            j, smaller_first = parent, True
+        else:
+            smaller_first = False
+        while j > 2:  # climb by grandparents within the same kind of level
+            grand = (((j - 1) >> 1) - 1) >> 1
+            if smaller_first:
+                moves = data[j]._key < data[grand]._key
+            else:
+                moves = data[grand]._key < data[j]._key
+            if not moves:
+                break
+            self._swap(j, grand)
+            j = grand
+
+    def _downheap(self, j):
+        """Move the item at index j down along its min or max levels."""
+        data = self._data
+        n = len(data)
+        smaller_first = self._is_min_level(j)
+        while True:
+            child = 2 * j + 1
+            if child >= n:
+                return
+            grandchild = 2 * child + 1
+            best = child  # best (smallest or largest) of children and grandchildren
+            for m in (child + 1, *range(grandchild, min(grandchild + 4, n))):
+                if m < n:
+                    if smaller_first:
+                        better = data[m]._key < data[best]._key
+                    else:
+                        better = data[best]._key < data[m]._key
+                    if better:
+                        best = m
+            if smaller_first:
+                moves = data[best]._key < data[j]._key
+            else:
+                moves = data[j]._key < data[best]._key
+            if not moves:
+                return
+            self._swap(j, best)
+            if best <= child + 1:  # a child: item now sits on the other kind of level
+                return
+            parent = (best - 1) >> 1  # a grandchild: fix its order against its parent
+            if smaller_first:
+                if data[parent]._key < data[best]._key:
+                    self._swap(best, parent)
+            elif data[best]._key < data[parent]._key:
+                self._swap(best, parent)
+            j = best
+
+    def _max_index(self):
+        """Return the index of an item with maximum key (queue nonempty)."""
+        data = self._data
+        if len(data) <= 2:
+            return len(data) - 1
+        return 2 if data[1]._key < data[2]._key else 1
+
+    def _remove_at(self, j):
+        """Remove and return the (k,v) tuple at index j."""
+        data = self._data
+        last = data.pop()
+        if j == len(data):  # the removed item was the final one
+            return (last._key, last._value)
+        item = data[j]
+        data[j] = last
+        self._downheap(j)
+        return (item._key, item._value)
+
+    def _heapify(self):
+        """Restore the min-max heap property over the whole array in O(n) time."""
+        for j in range(len(self._data) // 2 - 1, -1, -1):
+            self._downheap(j)
+
+    # ------------------------------ public behaviors ------------------------------
+    def __init__(self, capacity=None):
+        """Create a new empty Priority Queue, bounded to capacity entries if given."""
+        if capacity is not None and capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self._capacity = capacity
+        self._data = []
+
+    @classmethod
+    def from_items(cls, pairs, capacity=None):
+        """Create a Priority Queue from an iterable of (k,v) pairs in O(n) time.
+
+        If capacity is given, only the capacity entries with smallest keys
+        are kept.
+        """
+        pq = cls(capacity)
+        pq._data = [cls._Item(k, v) for k, v in pairs]
+        pq._heapify()
+        while capacity is not None and len(pq._data) > capacity:
+            pq.remove_max()
+        return pq
+
+    def __len__(self):
+        """Return the number of items in the priority queue."""
+        return len(self._data)
+
+    def add(self, key, value):
+        """Add a key-value pair to the priority queue.
+
+        When the queue is at capacity, the entry with maximum key (possibly
+        the new one) is evicted and returned as a (k,v) tuple; otherwise
+        return None.
+        """
+        evicted = None
+        if self._capacity is not None and len(self._data) >= self._capacity:
+            j = self._max_index()
+            if not key < self._data[j]._key:
+                return (key, value)  # the new entry is the least urgent
+            evicted = self._remove_at(j)
+        self._data.append(self._Item(key, value))
+        self._upheap(len(self._data) - 1)
+        return evicted
+
+    def min(self):
+        """Return but do not remove (k,v) tuple with minimum key.
+
+        Raise Empty exception if empty.
+        """
+        if self.is_empty():
+            raise Empty("Priority queue is empty.")
+        item = self._data[0]
+        return (item._key, item._value)
+
+    def max(self):
+        """Return but do not remove (k,v) tuple with maximum key.
+
+        Raise Empty exception if empty.
+        """
+        if self.is_empty():
+            raise Empty("Priority queue is empty.")
+        item = self._data[self._max_index()]
+        return (item._key, item._value)
+
+    def remove_min(self):
+        """Remove and return (k,v) tuple with minimum key.
+
+        Raise Empty exception if empty.
+        """
+        if self.is_empty():
+            raise Empty("Priority queue is empty.")
+        return self._remove_at(0)
+
+    def remove_max(self):
+        """Remove and return (k,v) tuple with maximum key.
+
+        Raise Empty exception if empty.
+        """
+        if self.is_empty():
+            raise Empty("Priority queue is empty.")
+        return self._remove_at(self._max_index())
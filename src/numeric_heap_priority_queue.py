@@ -0,0 +1,282 @@
+# Copyright 2013, Michael H. Goldwasser
+#
+# Developed for use with the book:
+#
+#    Data Structures and Algorithms in Python
+#    Michael T. Goodrich, Roberto Tamassia, and Michael H. Goldwasser
+#    John Wiley & Sons, 2013
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from array import array
+
+from priority_queue_base import PriorityQueueBase
+from exceptions import Empty
+from heap_snapshot import read_snapshot, write_snapshot
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; add_array falls back to pure Python
+    np = None
+
+
+class NumericHeapPriorityQueue(PriorityQueueBase):
+    """A min-oriented priority queue for numeric keys, stored as parallel arrays.
+
+    Keys live in a typed array (double precision by default) and values in
+    a parallel list, so no _Item is created per entry and comparisons are
+    plain number comparisons.
+    """
+
+    # ------------------------------ nonpublic behaviors ------------------------------
+    def _upheap(self, j):
+        keys = self._keys
+        values = self._values
+        key = keys[j]
+        value = values[j]
+        while j > 0:
+            parent = (j - 1) >> 1
+            above = keys[parent]
+            if not key < above:
+                break
+            keys[j] = above  # shift parent down into the hole
+            values[j] = values[parent]
+            j = parent
+        keys[j] = key
+        values[j] = value
+
+    def _downheap(self, j):
+        keys = self._keys
+        values = self._values
+        n = len(keys)
+        key = keys[j]
+        value = values[j]
+        child = 2 * j + 1
+        while child < n:
+            small = keys[child]
+            right = child + 1
+            if right < n:
+                other = keys[right]
+                if other < small:
+                    child = right
+                    small = other
+            if not small < key:
+                break
+            keys[j] = small  # shift smaller child up into the hole
+            values[j] = values[child]
+            j = child
+            child = 2 * j + 1
+        keys[j] = key
+        values[j] = value
+
+    def _heapify(self):
+        """Restore the heap property over the whole array in O(n) time."""
+        for j in range(len(self._keys) // 2 - 1, -1, -1):
+            self._downheap(j)
+
+    def _repair_tail(self, start):
+        """Restore the heap property after entries were appended from index start."""
+        n = len(self._keys)
+        if n - start >= start:
+            self._heapify()
+        else:
+            for j in range(start, n):
+                self._upheap(j)
+
+    def _pop_root(self):
+        """Remove the root of a nonempty heap and return it as a (k,v) tuple."""
+        keys = self._keys
+        values = self._values
+        last_key = keys.pop()
+        last_value = values.pop()
+        if not keys:
+            return (last_key, last_value)
+        result = (keys[0], values[0])
+        keys[0] = last_key  # the final entry replaces the minimum at the root
+        values[0] = last_value
+        self._downheap(0)
+        return result
+
+    # ------------------------------ public behaviors ------------------------------
+    def __init__(self, typecode="d"):
+        """Create a new empty Priority Queue.
+
+        Keys are stored in an array of the given typecode; use 'q' (or 'l')
+        to keep large integer keys exact.
+        """
+        self._keys = array(typecode)
+        self._values = []
+
+    @classmethod
+    def from_items(cls, pairs, typecode="d"):
+        """Create a Priority Queue from an iterable of (k,v) pairs in O(n) time."""
+        pq = cls(typecode)
+        pq.add_all(pairs)
+        return pq
+
+    def __len__(self):
+        """Return the number of items in the priority queue."""
+        return len(self._keys)
+
+    def add(self, key, value):
+        """Add a key-value pair to the priority queue."""
+        self._keys.append(key)
+        self._values.append(value)
+        self._upheap(len(self._keys) - 1)
+
+    def add_all(self, pairs):
+        """Add every (k,v) pair from an iterable to the priority queue."""
+        start = len(self._keys)
+        for key, value in pairs:
+            self._keys.append(key)
+            self._values.append(value)
+        self._repair_tail(start)
+
+    def add_array(self, keys, values):
+        """Add the pairs formed by two equal-length sequences of keys and values.
+
+        With NumPy installed the batch is sorted in C: a batch at least as
+        large as the queue is merged by sorting everything (a sorted array is
+        a valid heap); a smaller one is appended in sorted order and upheaped.
+        Without NumPy this is equivalent to add_all(zip(keys, values)).
+        Either way, raise TypeError if a key cannot be stored exactly, such as
+        a float key for an integer typecode.
+        """
+        if len(keys) != len(values):
+            raise ValueError("keys and values must have the same length")
+        if np is None:
+            self.add_all(zip(keys, values))
+            return
+        typecode = self._keys.typecode
+        batch = np.asarray(keys)
+        if batch.size and not np.can_cast(batch.dtype, typecode):  # as array would
+            raise TypeError(
+                "cannot store {0} keys in a '{1}' array".format(batch.dtype, typecode)
+            )
+        batch = batch.astype(typecode, copy=False)
+        start = len(self._keys)
+        if len(batch) >= start:  # rebuild: cheaper than upheaping the batch
+            existing = np.frombuffer(self._keys, dtype=typecode)
+            merged = np.concatenate((existing, batch))
+            del existing  # release the buffer export on self._keys
+            order = np.argsort(merged, kind="stable")
+            combined = self._values + list(values)
+            self._keys = array(typecode, merged[order].tobytes())
+            self._values = [combined[i] for i in order.tolist()]
+        else:
+            order = np.argsort(batch, kind="stable")
+            self._keys.frombytes(batch[order].tobytes())
+            self._values.extend([values[i] for i in order.tolist()])
+            for j in range(start, len(self._keys)):
+                self._upheap(j)
+
+    def min(self):
+        """Return but do not remove (k,v) tuple with minimum key.
+
+        Raise Empty exception if empty.
+        """
+        if self.is_empty():
+            raise Empty("Priority queue is empty.")
+        return (self._keys[0], self._values[0])
+
+    def remove_min(self):
+        """Remove and return (k,v) tuple with minimum key.
+
+        Raise Empty exception if empty.
+        """
+        if self.is_empty():
+            raise Empty("Priority queue is empty.")
+        return self._pop_root()
+
+    def pushpop(self, key, value):
+        """Add a key-value pair, then remove and return the (k,v) tuple with minimum key.
+
+        The new pair is returned without entering the heap if its key is no
+        larger than the current minimum.
+        """
+        keys = self._keys
+        if not keys or not keys[0] < key:
+            return (key, value)
+        result = (keys[0], self._values[0])
+        keys[0] = key
+        self._values[0] = value
+        self._downheap(0)
+        return result
+
+    def replace_min(self, key, value):
+        """Remove and return the (k,v) tuple with minimum key, then add a key-value pair.
+
+        Raise Empty exception if empty.
+        """
+        if self.is_empty():
+            raise Empty("Priority queue is empty.")
+        result = (self._keys[0], self._values[0])
+        self._keys[0] = key
+        self._values[0] = value
+        self._downheap(0)
+        return result
+
+    def remove_min_many(self, k):
+        """Remove and return a list of the k (k,v) tuples with smallest keys.
+
+        Tuples are listed in nondecreasing key order; fewer than k are
+        returned if the priority queue holds fewer than k items.
+        """
+        if k < 0:
+            raise ValueError("k must be nonnegative")
+        keys = self._keys
+        values = self._values
+        n = len(keys)
+        k = min(k, n)
+        if 10 * k >= n:  # large batch: sort once, the sorted rest is a valid heap
+            order = sorted(range(n), key=keys.__getitem__)
+            keys[:] = array(keys.typecode, [keys[i] for i in order])
+            values[:] = [values[i] for i in order]
+            result = list(zip(keys[:k], values[:k]))
+            del keys[:k]
+            del values[:k]
+            return result
+        return [self._pop_root() for _ in range(k)]
+
+    def drain(self):
+        """Generate (k,v) tuples in nondecreasing key order until empty.
+
+        Each tuple is removed from the priority queue as it is generated.
+        """
+        while self._keys:
+            yield self._pop_root()
+
+    def dump(self, fileobj):
+        """Write the contents to a binary file object, keeping the heap order.
+
+        The key array is written as one contiguous block; values are pickled.
+        """
+        write_snapshot(fileobj, 2, self._keys.typecode, self._keys, self._values)
+
+    @classmethod
+    def load(cls, fileobj):
+        """Create a Priority Queue from a snapshot written by any heap's dump.
+
+        A binary heap's order is reused as is; snapshots of wider heaps are
+        heapified once.  Raise ValueError if the snapshot keys are not numeric.
+        """
+        arity, typecode, keys, values = read_snapshot(fileobj)
+        if typecode == "O":
+            raise ValueError("snapshot keys are not numeric")
+        pq = cls(typecode)
+        pq._keys = keys
+        pq._values = values
+        if arity != 2:
+            pq._heapify()
+        return pq
@@ -0,0 +1,228 @@
+# Copyright 2013, Michael H. Goldwasser
+#
+# Developed for use with the book:
+#
+#    Data Structures and Algorithms in Python
+#    Michael T. Goodrich, Roberto Tamassia, and Michael H. Goldwasser
+#    John Wiley & Sons, 2013
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from priority_queue_base import PriorityQueueBase
+from exceptions import Empty
+
+
+class PairingHeapPriorityQueue(PriorityQueueBase):
+    """A mergeable, locator-based priority queue implemented with a pairing heap.
+
+    add and meld take O(1) time, remove_min and remove take amortized
+    O(log n) time, and decrease_key is at most O(log n) amortized.
+    """
+
+    # ------------------------------ nested _Owner class ------------------------------
+    class _Owner:
+        """Cell naming the heap of a Locator; meld forwards one cell to another."""
+
+        __slots__ = "_forward"
+
+        def __init__(self):
+            self._forward = None  # cell of the heap this one was melded into
+
+    # ------------------------------ nested Locator class ------------------------------
+    class Locator(PriorityQueueBase._Item):
+        """Token for locating an entry of the priority queue (also its tree node)."""
+
+        __slots__ = "_child", "_sibling", "_prev", "_owner"  # leftmost child, next
+        # sibling, parent (if leftmost child) or left sibling (None for the root),
+        # and the _Owner cell of the heap it was added to
+
+        def __init__(self, k, v, owner):
+            super().__init__(k, v)
+            self._child = self._sibling = self._prev = None
+            self._owner = owner
+
+    # ------------------------------ nonpublic behaviors ------------------------------
+    def _link(self, a, b):
+        """Make the larger of two detached roots the leftmost child of the other."""
+        if b._key < a._key:  # ties keep a, the earlier root, on top
+            a, b = b, a
+        child = a._child
+        b._sibling = child
+        if child is not None:
+            child._prev = b
+        b._prev = a
+        a._child = b
+        return a
+
+    def _cut(self, node):
+        """Detach the subtree rooted at nonroot node from its parent."""
+        prev = node._prev
+        sibling = node._sibling
+        if prev._child is node:
+            prev._child = sibling
+        else:
+            prev._sibling = sibling
+        if sibling is not None:
+            sibling._prev = prev
+        node._prev = node._sibling = None
+
+    def _merge_pairs(self, first):
+        """Combine a list of sibling subtrees into one and return its root."""
+        pairs = []
+        while first is not None:  # first pass: link siblings left to right in pairs
+            a = first
+            b = a._sibling
+            if b is None:
+                a._prev = None
+                pairs.append(a)
+                break
+            first = b._sibling
+            a._prev = a._sibling = b._prev = b._sibling = None
+            pairs.append(self._link(a, b))
+        root = pairs.pop() if pairs else None
+        while pairs:  # second pass: link the pairs right to left
+            root = self._link(pairs.pop(), root)
+        return root
+
+    def _detach(self, node):
+        """Remove node from the heap, keeping its descendants."""
+        children = node._child
+        node._child = None
+        if node is self._root:
+            self._root = self._merge_pairs(children)
+        else:
+            self._cut(node)
+            subtree = self._merge_pairs(children)
+            if subtree is not None:
+                self._root = self._link(self._root, subtree)
+
+    def _find_owner(self, loc):
+        """Return the current _Owner cell of loc, compressing the forwarding path."""
+        cell = loc._owner
+        while cell._forward is not None:
+            cell = cell._forward
+        walk = loc._owner
+        while walk is not cell:  # point every cell on the path straight at the end
+            walk._forward, walk = cell, walk._forward
+        loc._owner = cell
+        return cell
+
+    def _validate(self, loc):
+        """Raise ValueError if loc is not a live Locator of this priority queue."""
+        if (
+            not isinstance(loc, self.Locator)
+            or loc._prev is loc
+            or self._find_owner(loc) is not self._owner
+        ):
+            raise ValueError("Invalid locator")
+
+    # ------------------------------ public behaviors ------------------------------
+    def __init__(self):
+        """Create a new empty Priority Queue."""
+        self._root = None
+        self._size = 0
+        self._owner = self._Owner()
+
+    def __len__(self):
+        """Return the number of items in the priority queue."""
+        return self._size
+
+    def add(self, key, value):
+        """Add a key-value pair and return a Locator for the new entry."""
+        token = self.Locator(key, value, self._owner)
+        self._root = token if self._root is None else self._link(self._root, token)
+        self._size += 1
+        return token
+
+    def add_all(self, pairs):
+        """Add every (k,v) pair from an iterable and return a list of their Locators."""
+        return [self.add(k, v) for k, v in pairs]
+
+    def min(self):
+        """Return but do not remove (k,v) tuple with minimum key.
+
+        Raise Empty exception if empty.
+        """
+        if self.is_empty():
+            raise Empty("Priority queue is empty.")
+        return (self._root._key, self._root._value)
+
+    def remove_min(self):
+        """Remove and return (k,v) tuple with minimum key.
+
+        Raise Empty exception if empty.
+        """
+        if self.is_empty():
+            raise Empty("Priority queue is empty.")
+        return self.remove(self._root)
+
+    def remove_min_many(self, k):
+        """Remove and return a list of the k (k,v) tuples with smallest keys.
+
+        Tuples are listed in nondecreasing key order; fewer than k are
+        returned if the priority queue holds fewer than k items.
+        """
+        if k < 0:
+            raise ValueError("k must be nonnegative")
+        return [self.remove_min() for _ in range(min(k, self._size))]
+
+    def meld(self, other):
+        """Move every entry of another pairing heap into this one in O(1) time.
+
+        The other queue is left empty; its Locators remain valid for this one.
+        """
+        if other is self:
+            raise ValueError("cannot meld a priority queue with itself")
+        if not isinstance(other, PairingHeapPriorityQueue):
+            raise TypeError("other must be a PairingHeapPriorityQueue")
+        if other._root is not None:
+            if self._root is None:
+                self._root = other._root
+            else:
+                self._root = self._link(self._root, other._root)
+        self._size += other._size
+        other._owner._forward = self._owner  # other's Locators now belong here
+        other._root = None
+        other._size = 0
+        other._owner = self._Owner()
+
+    def decrease_key(self, loc, newkey):
+        """Lower the key of the entry identified by Locator loc to newkey."""
+        self._validate(loc)
+        if loc._key < newkey:
+            raise ValueError("new key must not be larger than the current key")
+        loc._key = newkey
+        if loc is not self._root:
+            self._cut(loc)  # subtree keeps its order; relink it at the top
+            self._root = self._link(self._root, loc)
+
+    def update(self, loc, newkey, newval):
+        """Update the key and value for the entry identified by Locator loc."""
+        self._validate(loc)
+        if not loc._key < newkey:
+            loc._value = newval
+            self.decrease_key(loc, newkey)
+        else:
+            self._detach(loc)  # a larger key may violate order below loc
+            loc._key = newkey
+            loc._value = newval
+            self._root = loc if self._root is None else self._link(self._root, loc)
+
+    def remove(self, loc):
+        """Remove and return the (k,v) pair identified by Locator loc."""
+        self._validate(loc)
+        self._detach(loc)
+        self._size -= 1
+        loc._prev = loc  # convention for deprecated locators
+        return (loc._key, loc._value)
@@ -0,0 +1,179 @@
+# Copyright 2013, Michael H. Goldwasser
+#
+# Developed for use with the book:
+#
+#    Data Structures and Algorithms in Python
+#    Michael T. Goodrich, Roberto Tamassia, and Michael H. Goldwasser
+#    John Wiley & Sons, 2013
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from priority_queue_base import PriorityQueueBase
+from exceptions import Empty
+
+
+class RadixHeapPriorityQueue(PriorityQueueBase):
+    """A min-oriented priority queue for monotone, nonnegative integer keys.
+
+    Keys may never be smaller than the most recently removed minimum.
+    Entry (k,v) lives in bucket i, the bit length of k XOR last, where last
+    is that minimum (min only peeks, so last moves in remove_min alone);
+    each entry moves to a lower bucket at most once per bit of the key
+    width, so operations cost O(log C) amortized for keys spanning a range
+    C, with no key comparisons on insertion.
+    """
+
+    # ------------------------------ nonpublic behaviors ------------------------------
+    def _pull(self):
+        """Ensure bucket 0 holds the entries with the minimum key (queue nonempty)."""
+        buckets = self._buckets
+        if buckets[0]:
+            return
+        i = 1
+        while not buckets[i]:
+            i += 1
+        bucket = buckets[i]
+        buckets[i] = []
+        last = bucket[0][0]
+        for entry in bucket:  # the smallest key becomes the new reference point
+            if entry[0] < last:
+                last = entry[0]
+        self._last = last
+        for entry in bucket:  # all land in lower buckets than i
+            buckets[(entry[0] ^ last).bit_length()].append(entry)
+
+    # ------------------------------ public behaviors ------------------------------
+    def __init__(self, start=0):
+        """Create a new empty Priority Queue accepting keys of at least start."""
+        self._buckets = [[]]
+        self._last = start  # every key must be at least this large
+        self._size = 0
+
+    def __len__(self):
+        """Return the number of items in the priority queue."""
+        return self._size
+
+    def add(self, key, value):
+        """Add a key-value pair.
+
+        Raise ValueError if key is smaller than the last removed minimum.
+        """
+        if key < self._last:
+            raise ValueError(
+                "key {0} is below the last minimum {1}".format(key, self._last)
+            )
+        i = (key ^ self._last).bit_length()
+        buckets = self._buckets
+        while len(buckets) <= i:
+            buckets.append([])
+        buckets[i].append((key, value))
+        self._size += 1
+
+    def min(self):
+        """Return but do not remove (k,v) tuple with minimum key.
+
+        Raise Empty exception if empty.
+        """
+        if self.is_empty():
+            raise Empty("Priority queue is empty.")
+        buckets = self._buckets
+        if buckets[0]:
+            return buckets[0][-1]
+        i = 1
+        while not buckets[i]:
+            i += 1
+        best = buckets[i][0]
+        for entry in buckets[i]:  # scan without redistributing: last stays put
+            if not best[0] < entry[0]:
+                best = entry  # the last minimal entry, as remove_min would pick
+        return best
+
+    def remove_min(self):
+        """Remove and return (k,v) tuple with minimum key.
+
+        Raise Empty exception if empty.
+        """
+        if self.is_empty():
+            raise Empty("Priority queue is empty.")
+        self._pull()
+        self._size -= 1
+        return self._buckets[0].pop()
+
+
+class BucketPriorityQueue(PriorityQueueBase):
+    """A min-oriented priority queue for monotone integer keys in range(max_key + 1).
+
+    One bucket per possible key and a cursor that moves back only when an
+    add lands between the last removed minimum and a peeked one make add
+    O(1) and remove_min O(1) amortized over a sweep of the key range.
+    """
+
+    # ------------------------------ nonpublic behaviors ------------------------------
+    def _advance(self):
+        """Move the cursor to the first nonempty bucket (queue nonempty)."""
+        buckets = self._buckets
+        cursor = self._cursor
+        while not buckets[cursor]:
+            cursor += 1
+        self._cursor = cursor
+
+    # ------------------------------ public behaviors ------------------------------
+    def __init__(self, max_key):
+        """Create a new empty Priority Queue accepting keys 0 to max_key."""
+        self._buckets = [[] for _ in range(max_key + 1)]
+        self._cursor = 0  # no nonempty bucket lies before the cursor
+        self._floor = 0  # the last removed minimum
+        self._size = 0
+
+    def __len__(self):
+        """Return the number of items in the priority queue."""
+        return self._size
+
+    def add(self, key, value):
+        """Add a key-value pair.
+
+        Raise ValueError if key is out of range or below the last removed minimum.
+        """
+        if not self._floor <= key < len(self._buckets):
+            raise ValueError(
+                "key {0} is outside [{1}, {2}]".format(
+                    key, self._floor, len(self._buckets) - 1
+                )
+            )
+        self._buckets[key].append(value)
+        if key < self._cursor:  # a min() may have moved the cursor past key
+            self._cursor = key
+        self._size += 1
+
+    def min(self):
+        """Return but do not remove (k,v) tuple with minimum key.
+
+        Raise Empty exception if empty.
+        """
+        if self.is_empty():
+            raise Empty("Priority queue is empty.")
+        self._advance()
+        return (self._cursor, self._buckets[self._cursor][-1])
+
+    def remove_min(self):
+        """Remove and return (k,v) tuple with minimum key.
+
+        Raise Empty exception if empty.
+        """
+        if self.is_empty():
+            raise Empty("Priority queue is empty.")
+        self._advance()
+        self._floor = self._cursor
+        self._size -= 1
+        return (self._cursor, self._buckets[self._cursor].pop())
@@ -0,0 +1,158 @@
+# Copyright 2013, Michael H. Goldwasser
+#
+# Developed for use with the book:
+#
+#    Data Structures and Algorithms in Python
+#    Michael T. Goodrich, Roberto Tamassia, and Michael H. Goldwasser
+#    John Wiley & Sons, 2013
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+import random
+
+from positional_list import PositionalList
+from sorted_priority_queue import SortedPriorityQueue
+
+
+class SkipPositionalList(PositionalList):
+    """A PositionalList whose nodes also carry skip-list towers.
+
+    Besides its _next link, a node of height h has forward links at levels
+    1 through h, stored as a list in _skips; heights are drawn so that each
+    level holds about half the nodes of the level below.  The header is a
+    tower of full height and the trailer ends every level.  Towers are kept
+    consistent by every insertion and deletion, and let last_not_after find
+    a place in a sorted list in expected O(log n) time.
+    """
+
+    _MAX_HEIGHT = 32
+
+    # -------------------------- nested _Node class --------------------------
+    class _Node(PositionalList._Node):
+        """Doubly linked node with a (possibly empty) tower of forward links."""
+
+        __slots__ = "_skips"
+
+        def __init__(self, element, prev, next):
+            super().__init__(element, prev, next)
+            self._skips = ()  # most nodes have no tower; share the empty tuple
+
+    # ------------------------------- utility methods -------------------------------
+    def _height(self):
+        """Return a random tower height, h with probability 2**-(h+1)."""
+        h = 0
+        while h < self._MAX_HEIGHT and random.random() < 0.5:
+            h += 1
+        return h
+
+    def _link(self, node, height):
+        """Splice a new node into levels 1..height, walking back for predecessors."""
+        node._skips = [None] * height
+        walk = node._prev
+        for level in range(height):
+            while len(walk._skips) <= level:  # the header is tall enough to stop here
+                walk = walk._prev
+            node._skips[level] = walk._skips[level]
+            walk._skips[level] = node
+
+    def _unlink(self, predecessor, forward):
+        """Redirect the towers of predecessor and nodes before it to forward.
+
+        forward[level] is the node that the removed nodes pointed to at that level.
+        """
+        walk = predecessor
+        for level, target in enumerate(forward):
+            while len(walk._skips) <= level:
+                walk = walk._prev
+            walk._skips[level] = target
+
+    # ------------------------------- accessors -------------------------------
+    def __init__(self):
+        """Create an empty list."""
+        super().__init__()
+        self._header._skips = [self._trailer] * self._MAX_HEIGHT
+        self._top = 0  # greatest height of any tower so far
+
+    def last_not_after(self, e):
+        """Return the Position of the last element not greater than e.
+
+        The list must be in nondecreasing order; return None if every
+        element is greater than e.
+        """
+        walk = self._header
+        trailer = self._trailer
+        for level in range(self._top - 1, -1, -1):  # descend the towers
+            forward = walk._skips[level]
+            while forward is not trailer and not e < forward._element:
+                walk = forward
+                forward = walk._skips[level]
+        forward = walk._next  # finish along the base level
+        while forward is not trailer and not e < forward._element:
+            walk = forward
+            forward = walk._next
+        return self._make_position(walk)
+
+    # ------------------------------- mutators -------------------------------
+    def _insert_between(self, e, predecessor, successor):
+        """Add element between existing nodes and return new Position."""
+        position = super()._insert_between(e, predecessor, successor)
+        height = self._height()
+        if height:
+            self._link(position._node, height)
+            self._top = max(self._top, height)
+        return position
+
+    def _delete_node(self, node):
+        """Delete nonsentinel node from the list and return its element."""
+        if node._skips:
+            self._unlink(node._prev, node._skips)
+        node._skips = ()
+        return super()._delete_node(node)
+
+    def _delete_run(self, predecessor, k):
+        """Delete the k nodes following predecessor and return their elements."""
+        forward = []  # where the removed towers lead, per level
+        walk = predecessor._next
+        for _ in range(k):
+            skips = walk._skips
+            forward[: len(skips)] = skips  # later nodes override earlier ones
+            walk._skips = ()
+            walk = walk._next
+        if forward:
+            self._unlink(predecessor, forward)
+        return super()._delete_run(predecessor, k)
+
+
+class SkipListSortedPriorityQueue(SortedPriorityQueue):
+    """A sorted priority queue whose adds search a skip-list overlay.
+
+    Items stay in a PositionalList, as in SortedPriorityQueue, but add
+    finds its place in expected O(log n) time instead of walking back
+    from the last Position.
+    """
+
+    # ------------------------------ public behaviors ------------------------------
+    def __init__(self):
+        """Create a new empty Priority Queue."""
+        self._data = SkipPositionalList()
+
+    def add(self, key, value):
+        """Add a key-value pair."""
+        newest = self._Item(key, value)  # make new item instance
+        walk = self._data.last_not_after(newest)  # after any equal keys
+        if walk is None:
+            self._data.add_first(newest)  # new key is smallest
+        else:
+            self._data.add_after(walk, newest)  # newest goes after walk
@@ -1,226 +1,6 @@
-class Empty(Exception):
-    """Error attempting to access an element from an empty container."""
-
-    pass
-
-
-class _DoublyLinkedBase:
-    """A base class providing a doubly linked list representation."""
-
-    # -------------------------- nested _Node class --------------------------
-    # nested _Node class
-    class _Node:
-        """Lightweight, nonpublic class for storing a doubly linked node."""
-
-        __slots__ = "_element", "_prev", "_next"  # streamline memory
-
-        def __init__(self, element, prev, next):  # initialize node's fields
-            self._element = element  # user's element
-            self._prev = prev  # previous node reference
-            self._next = next  # next node reference
-
-    # -------------------------- list constructor --------------------------
-
-    def __init__(self):
-        """Create an empty list."""
-        self._header = self._Node(None, None, None)
-        self._trailer = self._Node(None, None, None)
-        self._header._next = self._trailer  # trailer is after header
-        self._trailer._prev = self._header  # header is before trailer
-        self._size = 0  # number of elements
-
-    # -------------------------- public accessors --------------------------
-
-    def __len__(self):
-        """Return the number of elements in the list."""
-        return self._size
-
-    def is_empty(self):
-        """Return True if list is empty."""
-        return self._size == 0
-
-    # -------------------------- nonpublic utilities --------------------------
-
-    def _insert_between(self, e, predecessor, successor):
-        """Add element e between two existing nodes and return new node."""
-        newest = self._Node(e, predecessor, successor)  # linked to neighbors
-        predecessor._next = newest
-        successor._prev = newest
-        self._size += 1
-        return newest
-
-    def _delete_node(self, node):
-        """Delete nonsentinel node from the list and return its element."""
-        predecessor = node._prev
-        successor = node._next
-        predecessor._next = successor
-        successor._prev = predecessor
-        self._size -= 1
-        element = node._element  # record deleted element
-        node._prev = node._next = node._element = None  # deprecate node
-        return element  # return deleted element
-
-
-class PositionalList(_DoublyLinkedBase):
-    """A sequential container of elements allowing positional access."""
-
-    # -------------------------- nested Position class --------------------------
-    class Position:
-        """An abstraction representing the location of a single element.
-
-        Note that two position instaces may represent the same inherent
-        location in the list.  Therefore, users should always rely on
-        syntax 'p == q' rather than 'p is q' when testing equivalence of
-        positions.
-        """
-
-        def __init__(self, container, node):
-            """Constructor should not be invoked by user."""
-            self._container = container
-            self._node = node
-
-        def element(self):
-            """Return the element stored at this Position."""
-            return self._node._element
-
-        def __eq__(self, other):
-            """Return True if other is a Position representing the same location."""
-            return type(other) is type(self) and other._node is self._node
-
-        def __ne__(self, other):
-            """Return True if other does not represent the same location."""
-            return not (self == other)  # opposite of __eq__
-
-    # ------------------------------- utility methods -------------------------------
-    def _validate(self, p):
-        """Return position's node, or raise appropriate error if invalid."""
-        if not isinstance(p, self.Position):
-            raise TypeError("p must be proper Position type")
-        if p._container is not self:
-            raise ValueError("p does not belong to this container")
-        if p._node._next is None:  # convention for deprecated nodes
-            raise ValueError("p is no longer valid")
-        return p._node
-
-    def _make_position(self, node):
-        """Return Position instance for given node (or None if sentinel)."""
-        if node is self._header or node is self._trailer:
-            return None  # boundary violation
-        else:
-            return self.Position(self, node)  # legitimate position
-
-    # ------------------------------- accessors -------------------------------
-    def first(self):
-        """Return the first Position in the list (or None if list is empty)."""
-        return self._make_position(self._header._next)
-
-    def last(self):
-        """Return the last Position in the list (or None if list is empty)."""
-        return self._make_position(self._trailer._prev)
-
-    def before(self, p):
-        """Return the Position just before Position p (or None if p is first)."""
-        node = self._validate(p)
-        return self._make_position(node._prev)
-
-    def after(self, p):
-        """Return the Position just after Position p (or None if p is last)."""
-        node = self._validate(p)
-        return self._make_position(node._next)
-
-    def __iter__(self):
-        """Generate a forward iteration of the elements of the list."""
-        cursor = self.first()
-        while cursor is not None:
-            yield cursor.element()
-            cursor = self.after(cursor)
-
-    # ------------------------------- mutators -------------------------------
-    # override inherited version to return Position, rather than Node
-    def _insert_between(self, e, predecessor, successor):
-        """Add element between existing nodes and return new Position."""
-        node = super()._insert_between(e, predecessor, successor)
-        return self._make_position(node)
-
-    def add_first(self, e):
-        """Insert element e at the front of the list and return new Position."""
-        return self._insert_between(e, self._header, self._header._next)
-
-    def add_last(self, e):
-        """Insert element e at the back of the list and return new Position."""
-        return self._insert_between(e, self._trailer._prev, self._trailer)
-
-    def add_before(self, p, e):
-        """Insert element e into list before Position p and return new Position."""
-        original = self._validate(p)
-        return self._insert_between(e, original._prev, original)
-
-    def add_after(self, p, e):
-        """Insert element e into list after Position p and return new Position."""
-        original = self._validate(p)
-        return self._insert_between(e, original, original._next)
-
-    def delete(self, p):
-        """Remove and return the element at Position p."""
-        original = self._validate(p)
-        return self._delete_node(original)  # inherited method returns element
-
-    def replace(self, p, e):
-        """Replace the element at Position p with e.
-
-        Return the element formerly at Position p.
-        """
-        original = self._validate(p)
-        old_value = original._element  # temporarily store old element
-        original._element = e  # replace with new element
-        return old_value  # return the old element value
-
-
-class PriorityQueueBase:
-    """Abstract base class for a priority queue."""
-
-    # ------------------------------ nested _Item class ------------------------------
-    class _Item:
-        """Lightweight composite to store priority queue items."""
-
-        __slots__ = "_key", "_value"
-
-        def __init__(self, k, v):
-            self._key = k
-            self._value = v
-
-        def __lt__(self, other):
-            return self._key < other._key  # compare items based on their keys
-
-        def __repr__(self):
-            return "({0},{1})".format(self._key, self._value)
-
-    # ------------------------------ public behaviors ------------------------------
-    def is_empty(self):  # concrete method assuming abstract len
-        """Return True if the priority queue is empty."""
-        return len(self) == 0
-
-    def __len__(self):
-        """Return the number of items in the priority queue."""
-        raise NotImplementedError("must be implemented by subclass")
-
-    def add(self, key, value):
-        """Add a key-value pair."""
-        raise NotImplementedError("must be implemented by subclass")
-
-    def min(self):
-        """Return but do not remove (k,v) tuple with minimum key.
-
-        Raise Empty exception if empty.
-        """
-        raise NotImplementedError("must be implemented by subclass")
-
-    def remove_min(self):
-        """Remove and return (k,v) tuple with minimum key.
-
-        Raise Empty exception if empty.
-        """
-        raise NotImplementedError("must be implemented by subclass")
+from priority_queue_base import PriorityQueueBase
+from positional_list import PositionalList
+from exceptions import Empty
 
 
 class SortedPriorityQueue(PriorityQueueBase):  # base class defines _Item
@@ -246,6 +26,30 @@ class SortedPriorityQueue(PriorityQueueBase):  # base class defines _Item
         else:
             self._data.add_after(walk, newest)  # newest goes after walk
 
+    def add_many(self, pairs):
+        """Add every (k,v) pair from an iterable in a single merge pass.
+
+        The batch is sorted once and merged into the list in O(n + m log m)
+        time; a batch whose keys are no smaller than the current maximum is
+        appended directly.  Equal keys keep the order in which they were added.
+        """
+        batch = sorted(self._Item(k, v) for k, v in pairs)  # stable for equal keys
+        if not batch:
+            return
+        last = self._data.last()
+        if last is None or not batch[0] < last.element():  # all past the maximum
+            for item in batch:
+                self._data.add_last(item)
+            return
+        walk = self._data.first()
+        for item in batch:
+            while walk is not None and not item < walk.element():
+                walk = self._data.after(walk)  # pass smaller and equal keys
+            if walk is None:
+                self._data.add_last(item)
+            else:
+                self._data.add_before(walk, item)
+
     def min(self):
         """Return but do not remove (k,v) tuple with minimum key.
 
@@ -266,3 +70,43 @@ class SortedPriorityQueue(PriorityQueueBase):  # base class defines _Item
             raise Empty("Priority queue is empty.")
         item = self._data.delete(self._data.first())
         return (item._key, item._value)
+
+    def remove_min_many(self, k):
+        """Remove and return a list of the k (k,v) tuples with smallest keys.
+
+        Tuples are listed in nondecreasing key order; fewer than k are
+        returned if the priority queue holds fewer than k items.
+        """
+        if k < 0:
+            raise ValueError("k must be nonnegative")
+        items = self._data.delete_first(min(k, len(self._data)))
+        return [(item._key, item._value) for item in items]
+
+    def pop_while(self, predicate):
+        """Remove and return minimum (k,v) tuples for as long as predicate(k) holds.
+
+        Tuples are listed in nondecreasing key order.  predicate must hold
+        for a prefix of the key order: if it holds for a key, it holds for
+        every smaller key.
+        """
+        count = 0
+        walk = self._data.first()
+        while walk is not None and predicate(walk.element()._key):
+            count += 1
+            walk = self._data.after(walk)
+        return self.remove_min_many(count)  # the prefix is unlinked in one splice
+
+    def remove_until(self, threshold):
+        """Remove and return every (k,v) tuple with key no greater than threshold.
+
+        Tuples are listed in nondecreasing key order.
+        """
+        return self.pop_while(lambda key: not threshold < key)
+
+    def drain(self):
+        """Generate (k,v) tuples in nondecreasing key order until empty.
+
+        Each tuple is removed from the priority queue as it is generated.
+        """
+        while not self._data.is_empty():
+            yield self.remove_min()
@@ -0,0 +1,104 @@
+# Copyright 2013, Michael H. Goldwasser
+#
+# Developed for use with the book:
+#
+#    Data Structures and Algorithms in Python
+#    Michael T. Goodrich, Roberto Tamassia, and Michael H. Goldwasser
+#    John Wiley & Sons, 2013
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from operator import itemgetter
+
+from heap_priority_queue import HeapPriorityQueue
+
+
+class TopK:
+    """A bounded collector of the k best (key, value) pairs seen in a stream.
+
+    The kept pairs live in a list of k slots, indexed by a size-k
+    HeapPriorityQueue whose root is the worst of them, so a candidate that
+    does not beat the root is rejected with one comparison and memory stays
+    O(k).
+    """
+
+    # ------------------------------ nested _Reversed class ------------------------------
+    class _Reversed:
+        """Key wrapper inverting the order, turning the min-heap into a max-heap."""
+
+        __slots__ = "_key"
+
+        def __init__(self, key):
+            self._key = key
+
+        def __lt__(self, other):
+            return other._key < self._key
+
+    # ------------------------------ public behaviors ------------------------------
+    def __init__(self, k, largest=True):
+        """Create a collector of the k largest (or k smallest) keys."""
+        if k < 0:
+            raise ValueError("k must be nonnegative")
+        self._k = k
+        self._largest = largest
+        self._pairs = []  # the kept (key, value) pairs, one slot each
+        self._heap = HeapPriorityQueue()  # holds (wrapped key, slot in _pairs)
+        self._threshold = None  # key of the worst kept pair, once k are kept
+
+    def __len__(self):
+        """Return the number of pairs kept."""
+        return len(self._heap)
+
+    def push(self, key, value):
+        """Offer a key-value pair; return True if it was kept."""
+        threshold = self._threshold
+        if threshold is not None:  # full: one compare against the worst kept
+            if self._largest:
+                if not threshold < key:
+                    return False
+            elif not key < threshold:
+                return False
+        elif len(self._heap) == self._k:  # only when k is 0
+            return False
+        heap = self._heap
+        wrapped = key if self._largest else self._Reversed(key)
+        pairs = self._pairs
+        if len(heap) < self._k:
+            heap.add(wrapped, len(pairs))
+            pairs.append((key, value))
+        else:
+            slot = heap.min()[1]  # the new pair takes the worst kept pair's slot
+            heap.replace_min(wrapped, slot)
+            pairs[slot] = (key, value)
+        if len(heap) == self._k:
+            self._threshold = pairs[heap.min()[1]][0]
+        return True
+
+    def extend(self, pairs):
+        """Offer every (key, value) pair from an iterable."""
+        push = self.push
+        for key, value in pairs:
+            push(key, value)
+
+    def merge(self, other):
+        """Offer every pair kept by another TopK of the same orientation."""
+        if other is self:
+            raise ValueError("cannot merge a collector into itself")
+        if other._largest != self._largest:
+            raise ValueError("cannot merge collectors of opposite orientation")
+        self.extend(other.result())
+
+    def result(self):
+        """Return a list of the kept (key, value) pairs, best first."""
+        return sorted(self._pairs, key=itemgetter(0), reverse=self._largest)
@@ -0,0 +1,61 @@
+import pytest
+
+from adaptable_heap_priority_queue import AdaptableHeapPriorityQueue
+from exceptions import Empty
+from heap_priority_queue import HeapPriorityQueue
+
+
+def _contents(pq):
+    return sorted((loc._key, loc._value) for loc in pq._data)
+
+
+@pytest.mark.parametrize("batch", [2, 60])  # bubbled and heapified paths
+def test_update_many_with_invalid_locator_changes_nothing(batch):
+    pq = AdaptableHeapPriorityQueue()
+    locs = pq.add_all((key, key) for key in range(100))
+    stale = pq.add(500, "stale")
+    pq.remove(stale)
+    before = _contents(pq)
+    changes = [(loc, -loc._key, "new") for loc in locs[:batch]]
+    changes.insert(batch // 2, (stale, 0, "bad"))
+    with pytest.raises(ValueError):
+        pq.update_many(changes)
+    assert _contents(pq) == before
+
+
+@pytest.mark.parametrize("batch", [2, 60])
+def test_update_many_applies_every_change(batch):
+    pq = AdaptableHeapPriorityQueue()
+    locs = pq.add_all((key, key) for key in range(100))
+    pq.update_many((loc, -loc._key, "new") for loc in locs[:batch])
+    assert pq.remove_min() == (-(batch - 1), "new")
+    assert len(pq) == 99
+
+
+@pytest.mark.parametrize("cls", [HeapPriorityQueue, AdaptableHeapPriorityQueue])
+def test_pushpop_and_replace_min_return_pairs(cls):
+    pq = cls()
+    pq.add_all((key, str(key)) for key in (4, 2, 6))
+    assert pq.pushpop(1, "one") == (1, "one")
+    assert pq.pushpop(5, "five") == (2, "2")
+    assert pq.replace_min(3, "three") == (4, "4")
+    assert [pq.remove_min() for _ in range(len(pq))] == [
+        (3, "three"),
+        (5, "five"),
+        (6, "6"),
+    ]
+    with pytest.raises(Empty):
+        pq.replace_min(1, "one")
+
+
+def test_locator_variants_return_usable_locators():
+    pq = AdaptableHeapPriorityQueue()
+    pq.add_all((key, str(key)) for key in (4, 2, 6))
+    assert pq.pushpop_locator(1, "one") == ((1, "one"), None)
+    pair, loc = pq.pushpop_locator(5, "five")
+    assert pair == (2, "2")
+    pq.update(loc, 0, "zero")
+    pair, loc = pq.replace_min_locator(7, "seven")
+    assert pair == (0, "zero")
+    assert pq.remove(loc) == (7, "seven")
+    assert [pq.remove_min() for _ in range(len(pq))] == [(4, "4"), (6, "6")]
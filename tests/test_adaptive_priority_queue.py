@@ -0,0 +1,49 @@
+import random
+
+import pytest
+
+from adaptive_priority_queue import AdaptivePriorityQueue
+from unsorted_priority_queue import UnsortedPriorityQueue
+
+
+@pytest.mark.parametrize("source", ["sorted", "unsorted", "heap"])
+@pytest.mark.parametrize("target", ["sorted", "unsorted", "heap"])
+def test_migration_keeps_every_entry(source, target):
+    rng = random.Random(20)
+    pq = AdaptivePriorityQueue(engine=source)
+    pairs = [(rng.randint(0, 50), j) for j in range(300)]
+    for key, value in pairs:
+        pq.add(key, value)
+    pq._migrate(target)
+    assert pq.engine() == target and len(pq) == len(pairs)
+    drained = [pq.remove_min() for _ in range(len(pairs))]
+    assert [key for key, _ in drained] == sorted(key for key, _ in pairs)
+    assert sorted(drained) == sorted(pairs)
+
+
+def test_workload_changes_trigger_migrations():
+    rng = random.Random(2)
+    pq = AdaptivePriorityQueue(engine="unsorted", window=64)
+    reference = []
+    for _ in range(8000):  # a heap-friendly mix of random adds and removals
+        if rng.random() < 0.55 or not reference:
+            key = rng.random()
+            pq.add(key, None)
+            reference.append(key)
+        else:
+            key = pq.remove_min()[0]
+            assert key == min(reference)
+            reference.remove(key)
+    assert pq.engine() != "unsorted"
+    assert [pq.remove_min()[0] for _ in range(len(pq))] == sorted(reference)
+
+
+def test_unsorted_remove_min_many_keeps_ties_in_insertion_order():
+    pq = UnsortedPriorityQueue()
+    for key, value in [(3, "a"), (1, "b"), (3, "c"), (2, "d"), (1, "e")]:
+        pq.add(key, value)
+    assert pq.remove_min_many(3) == [(1, "b"), (1, "e"), (2, "d")]
+    assert len(pq) == 2
+    assert pq.remove_min() == (3, "a")
+    with pytest.raises(ValueError):
+        pq.remove_min_many(-1)
@@ -0,0 +1,43 @@
+import asyncio
+
+from async_priority_queue import AsyncPriorityQueue
+
+
+def test_get_batch_returns_key_order():
+    async def main():
+        queue = AsyncPriorityQueue()
+
+        async def produce():
+            for value, key in enumerate((10, 9, 8, 7)):
+                await queue.put(key, value)
+                await asyncio.sleep(0.01)
+
+        producer = asyncio.create_task(produce())
+        batch = await queue.get_batch(4, max_wait=2)
+        await producer
+        return batch
+
+    assert asyncio.run(main()) == [(7, 3), (8, 2), (9, 1), (10, 0)]
+
+
+def test_timeout_after_wakeup_passes_the_wakeup_on(monkeypatch):
+    real_wait_for = asyncio.wait_for
+
+    async def late_timeout(fut, timeout):
+        # the waiter is woken, but wait_for reports a timeout anyway
+        if timeout == 0.5:
+            await fut
+            raise asyncio.TimeoutError
+        return await real_wait_for(fut, timeout)
+
+    monkeypatch.setattr(asyncio, "wait_for", late_timeout)
+
+    async def main():
+        queue = AsyncPriorityQueue()
+        late = asyncio.create_task(queue._wait(queue._getters, 0.5))
+        second = asyncio.create_task(queue._wait(queue._getters, 5))
+        await asyncio.sleep(0)
+        queue._wakeup_next(queue._getters)  # wakes late, which then times out
+        return await late, await asyncio.wait_for(second, 1)
+
+    assert asyncio.run(main()) == (False, True)
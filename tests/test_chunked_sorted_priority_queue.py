@@ -0,0 +1,30 @@
+import random
+
+from chunked_sorted_priority_queue import ChunkedSortedPriorityQueue
+
+
+def test_small_add_many_batches_fill_chunks():
+    pq = ChunkedSortedPriorityQueue(load=100)
+    for start in range(0, 20000, 3):  # ascending batches, each far below the load
+        pq.add_many((k, k) for k in range(start, start + 3))
+    assert len(pq) == 20001
+    assert len(pq._keys) <= len(pq) // 100 + 1
+    assert [k for k, _ in pq.drain()] == list(range(20001))
+
+
+def test_add_many_matches_sorted_reference():
+    rng = random.Random(24)
+    pq = ChunkedSortedPriorityQueue(load=8)
+    reference = []
+    for _ in range(300):
+        batch = [
+            (rng.randint(0, 1000), rng.random()) for _ in range(rng.randint(0, 20))
+        ]
+        pq.add_many(batch)
+        reference.extend(batch)
+        if rng.random() < 0.3 and reference:
+            reference.sort(key=lambda pair: pair[0])
+            assert pq.remove_min() == reference.pop(0)
+        assert len(pq._keys) <= len(pq) // 4 + 1
+    reference.sort(key=lambda pair: pair[0])
+    assert list(pq.drain()) == reference
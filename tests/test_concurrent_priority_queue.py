@@ -0,0 +1,84 @@
+import heapq
+import random
+import threading
+
+import pytest
+
+from concurrent_priority_queue import ShardedPriorityQueue
+from exceptions import Empty
+
+
+def _run_threads(targets):
+    workers = [threading.Thread(target=target) for target in targets]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+
+@pytest.mark.parametrize("strict", [True, False])
+@pytest.mark.parametrize("threads", [1, 4, 8])
+def test_every_entry_taken_exactly_once(strict, threads):
+    queue = ShardedPriorityQueue(4, strict=strict)
+    per_thread = 2000
+    produced = [
+        [(random.Random(t).random(), (t, j)) for j in range(per_thread)]
+        for t in range(threads)
+    ]
+    taken = [None] * threads
+
+    def produce(t):
+        for key, value in produced[t]:
+            queue.put(key, value)
+
+    def consume(t):
+        taken[t] = [queue.get(timeout=30) for _ in range(per_thread)]
+
+    _run_threads(
+        [lambda t=t: produce(t) for t in range(threads)]
+        + [lambda t=t: consume(t) for t in range(threads)]
+    )
+    expected = sorted(pair for chunk in produced for pair in chunk)
+    assert sorted(pair for chunk in taken for pair in chunk) == expected
+    assert queue.is_empty()
+
+
+def test_strict_get_matches_heapq():
+    rng = random.Random(13)
+    queue = ShardedPriorityQueue(4, strict=True)
+    reference = []
+    for j in range(5000):
+        if rng.random() < 0.6 or not reference:
+            key = rng.randint(0, 100)
+            queue.put(key, j)
+            heapq.heappush(reference, key)
+        else:
+            assert queue.get()[0] == heapq.heappop(reference)
+    assert [queue.get()[0] for _ in range(len(reference))] == sorted(reference)
+
+
+def test_strict_concurrent_consumers_see_nondecreasing_keys():
+    rng = random.Random(7)
+    queue = ShardedPriorityQueue(4, strict=True)
+    keys = [rng.random() for _ in range(8000)]
+    for key in keys:
+        queue.put(key, None)
+    taken = [None] * 4
+
+    def consume(t):
+        taken[t] = [queue.get()[0] for _ in range(len(keys) // 4)]
+
+    _run_threads([lambda t=t: consume(t) for t in range(4)])
+    for chunk in taken:
+        assert chunk == sorted(chunk)
+    assert sorted(key for chunk in taken for key in chunk) == sorted(keys)
+
+
+def test_get_on_empty_queue_raises_empty():
+    queue = ShardedPriorityQueue()
+    with pytest.raises(Empty):
+        queue.get_nowait()
+    with pytest.raises(Empty):
+        queue.get(block=False, timeout=1)  # timeout is ignored when not blocking
+    with pytest.raises(Empty):
+        queue.get(timeout=0.01)
@@ -0,0 +1,24 @@
+import heapq
+import random
+
+from external_priority_queue import ExternalPriorityQueue
+
+
+def test_spilling_queue_matches_heapq():
+    rng = random.Random(17)
+    with ExternalPriorityQueue(budget=2000, fan_in=3) as pq:
+        reference = []
+        for j in range(4000):
+            if rng.random() < 0.7 or not reference:
+                key = rng.randint(0, 300)
+                pq.add(key, j)
+                heapq.heappush(reference, key)
+            else:
+                assert pq.min()[0] == reference[0]
+                assert pq.remove_min()[0] == heapq.heappop(reference)
+            assert len(pq) == len(reference)
+            assert pq.spill_stats()["open_runs"] <= 3
+        stats = pq.spill_stats()
+        assert stats["runs"] > 3 and stats["merges"] > 0
+        drained = [pq.remove_min()[0] for _ in range(len(pq))]
+        assert drained == sorted(reference)
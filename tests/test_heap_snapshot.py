@@ -0,0 +1,38 @@
+import io
+
+import pytest
+
+from heap_priority_queue import HeapPriorityQueue
+
+
+def _snapshot(keys):
+    pq = HeapPriorityQueue.from_items((key, str(key)) for key in keys)
+    fileobj = io.BytesIO()
+    pq.dump(fileobj)
+    return fileobj.getvalue()
+
+
+@pytest.mark.parametrize("keys", [[5, 1, 4], [2.5, 0.5], ["b", "a"]])
+def test_round_trip(keys):
+    pq = HeapPriorityQueue.load(io.BytesIO(_snapshot(keys)))
+    assert [pq.remove_min() for _ in range(len(pq))] == [
+        (key, str(key)) for key in sorted(keys)
+    ]
+
+
+def test_wide_arity_round_trip():
+    pq = HeapPriorityQueue.from_items(((key, None) for key in range(1000)), arity=300)
+    fileobj = io.BytesIO()
+    pq.dump(fileobj)
+    fileobj.seek(0)
+    assert [key for key, _ in HeapPriorityQueue.load(fileobj).drain()] == list(
+        range(1000)
+    )
+
+
+@pytest.mark.parametrize("keys", [[5, 1, 4], ["b", "a"]])
+def test_every_truncation_raises_value_error(keys):
+    data = _snapshot(keys)
+    for cut in range(len(data)):
+        with pytest.raises(ValueError):
+            HeapPriorityQueue.load(io.BytesIO(data[:cut]))
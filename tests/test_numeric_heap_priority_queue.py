@@ -0,0 +1,45 @@
+import pytest
+
+import numeric_heap_priority_queue
+from numeric_heap_priority_queue import NumericHeapPriorityQueue
+
+backends = pytest.mark.parametrize("numpy", [True, False], ids=["numpy", "array"])
+
+
+@pytest.fixture
+def use_backend(monkeypatch):
+    def use(numpy):
+        if numpy:
+            pytest.importorskip("numpy")
+        else:
+            monkeypatch.setattr(numeric_heap_priority_queue, "np", None)
+
+    return use
+
+
+@backends
+def test_add_array_rejects_float_keys_for_integer_typecode(use_backend, numpy):
+    use_backend(numpy)
+    pq = NumericHeapPriorityQueue("q")
+    pq.add(5, "five")
+    with pytest.raises(TypeError):
+        pq.add_array([2.7, 1.0], ["a", "b"])
+    assert len(pq) == 1 and pq.min() == (5, "five")
+
+
+@backends
+@pytest.mark.parametrize(
+    "typecode, base, batch",
+    [
+        ("q", [], [9, -3, 4, 4, 0]),
+        ("q", [5, 1, 8, 2, 7, 3, 6], [9, -3, 4]),
+        ("d", [0.5, 2.0], [2.5, 1, -7.25, 3]),
+        ("d", [float(k) for k in range(10)], [2.5, -1.0]),
+    ],
+)
+def test_add_array_matches_add(use_backend, numpy, typecode, base, batch):
+    use_backend(numpy)
+    pq = NumericHeapPriorityQueue.from_items(((k, None) for k in base), typecode)
+    pq.add_array(batch, [None] * len(batch))
+    pq.add_array([], [])
+    assert [pq.remove_min()[0] for _ in range(len(pq))] == sorted(base + batch)
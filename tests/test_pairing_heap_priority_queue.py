@@ -0,0 +1,97 @@
+import heapq
+import random
+
+import pytest
+
+from exceptions import Empty
+from heap_priority_queue import HeapPriorityQueue
+from pairing_heap_priority_queue import PairingHeapPriorityQueue
+
+queue_classes = pytest.mark.parametrize(
+    "cls", [HeapPriorityQueue, PairingHeapPriorityQueue]
+)
+
+
+@queue_classes
+def test_empty_queue_raises_empty(cls):
+    pq = cls()
+    assert len(pq) == 0 and pq.is_empty()
+    with pytest.raises(Empty):
+        pq.min()
+    with pytest.raises(Empty):
+        pq.remove_min()
+    pq.add(1, "a")
+    pq.remove_min()
+    with pytest.raises(Empty):
+        pq.remove_min()
+
+
+@queue_classes
+def test_min_and_remove_min_match_heapq(cls):
+    rng = random.Random(8)
+    pq = cls()
+    reference = []
+    for j in range(3000):
+        if rng.random() < 0.6 or not reference:
+            key = rng.randint(0, 500)
+            pq.add(key, j)
+            heapq.heappush(reference, (key, j))
+        else:
+            assert pq.min()[0] == reference[0][0]
+            key, value = pq.remove_min()
+            assert key == reference[0][0]
+            reference.remove((key, value))
+            heapq.heapify(reference)
+        assert len(pq) == len(reference)
+    rest = [pq.remove_min() for _ in range(len(pq))]
+    assert [key for key, _ in rest] == sorted(key for key, _ in reference)
+    assert sorted(rest) == sorted(reference)
+
+
+@queue_classes
+def test_equal_keys(cls):
+    pq = cls()
+    for value in range(50):
+        pq.add(7, value)
+    pq.add(3, "low")
+    pq.add(9, "high")
+    assert pq.remove_min() == (3, "low")
+    taken = []
+    for _ in range(50):
+        assert pq.min() == pq.min()
+        expected = pq.min()
+        assert pq.remove_min() == expected
+        taken.append(expected)
+    assert [key for key, _ in taken] == [7] * 50
+    assert sorted(value for _, value in taken) == list(range(50))
+    assert pq.remove_min() == (9, "high")
+
+
+@queue_classes
+def test_add_all(cls):
+    rng = random.Random(80)
+    pq = cls()
+    pairs = [(rng.randint(0, 100), j) for j in range(1000)]
+    pq.add_all(pairs[:400])
+    pq.add(50, "single")
+    pq.add_all(iter(pairs[400:]))
+    pq.add_all([])
+    assert len(pq) == 1001
+    result = [pq.remove_min() for _ in range(len(pq))]
+    assert sorted(result, key=repr) == sorted(pairs + [(50, "single")], key=repr)
+    assert [key for key, _ in result] == sorted(key for key, _ in result)
+
+
+@queue_classes
+def test_remove_min_many(cls):
+    rng = random.Random(800)
+    keys = [rng.random() for _ in range(500)]
+    pq = cls()
+    pq.add_all((key, None) for key in keys)
+    assert pq.remove_min_many(0) == []
+    assert [key for key, _ in pq.remove_min_many(100)] == sorted(keys)[:100]
+    assert len(pq) == 400
+    assert [key for key, _ in pq.remove_min_many(1000)] == sorted(keys)[100:]
+    assert pq.is_empty()
+    with pytest.raises(ValueError):
+        pq.remove_min_many(-1)